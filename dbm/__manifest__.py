@@ -23,7 +23,7 @@
 	'name': 'DBM International',
 	'category': '',
 	'author': 'Eduard Oboroceanu',
-	'version': '1.1',
+	'version': '1.2',
 	'depends': [
 		"base", "contacts", "project", "base_import", "helpdesk_mgmt", "stock"
 	],
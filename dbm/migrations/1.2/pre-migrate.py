@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# © 2025 - TODAY  Eduard Oboroceanu
+# See LICENSE and COPYRIGHT files for full copyright and licensing details.
+
+import logging
+
+_logger = logging.getLogger(__name__)
+
+WARRANTY_COLUMNS = ('labor_warranty', 'parts_warranty', 'onsite_warranty')
+
+
+def migrate(cr, version):
+    """
+    Convert stock.lot warranty columns from timestamp to date. The ORM would cast
+    the column in place anyway, this makes the cast explicit: the UTC timestamps
+    are converted to the date of the administrator's timezone (UTC if not set),
+    so that warranties entered around midnight local time keep their day
+    """
+    if not version:
+        return
+    cr.execute("""
+        SELECT column_name
+          FROM information_schema.columns
+         WHERE table_name = 'stock_lot'
+           AND column_name IN %s
+           AND data_type LIKE 'timestamp%%'
+    """, (WARRANTY_COLUMNS,))
+    columns = [column for column, in cr.fetchall()]
+    if not columns:
+        return
+    cr.execute("""
+        SELECT p.tz
+          FROM ir_model_data d
+          JOIN res_users u ON u.id = d.res_id
+          JOIN res_partner p ON p.id = u.partner_id
+         WHERE d.module = 'base' AND d.name = 'user_admin'
+    """)
+    row = cr.fetchone()
+    tz = (row and row[0]) or 'UTC'
+    for column in columns:
+        cr.execute(
+            f"ALTER TABLE stock_lot ALTER COLUMN {column} TYPE date "
+            f"USING ({column} AT TIME ZONE 'UTC' AT TIME ZONE %s)::date",
+            (tz,)
+        )
+        _logger.info("Converted stock_lot.%s to date (timezone %s)", column, tz)
@@ -17,8 +17,3 @@ class HelpdeskTicket(models.Model):
     assigned_date = fields.Datetime(string="Data assegnazione")
     planned_date = fields.Datetime(string="Data pianificazione")
 
-    @api.model_create_multi
-    def create(self, list_vals):
-        res = super(HelpdeskTicket, self).create(list_vals)
-        return res
-
@@ -14,34 +14,20 @@ _logger = logging.getLogger(__name__)
 class ResPartner(models.Model):
     _inherit = "res.partner"
 
+    _sql_constraints = [
+        ('ref_uniq', 'unique(ref)', 'A partner with this codice already exists. Please use a unique codice.'),
+    ]
     
-    @api.constrains('ref')
-    def _check_codice_unique(self):
-        """
-        Ensure codice is unique across all partners
-        """
-        for record in self:
-            if record.ref:
-                existing = self.search([
-                    ('ref', '=', record.ref),
-                    ('id', '!=', record.id)
-                ])
-                if existing:
-                    raise ValidationError(
-                        f"Partner with codice '{record.ref}' already exists. "
-                        f"Please use a unique codice."
-                    )
-    
-
     def action_view_stock_lots_history(self):
-        action = {
-            'type': 'ir.actions.act_window',
-            'name': 'Lotti a Noleggio',
-            'res_model': 'stock.lot',
-            'view_mode': 'list,form',
-            'domain': [('rental_company_id', 'in', self.ids)],
-            'context': dict(self.env.context),
-        }
+        context = dict(self.env.context)
+        if len(self) == 1:
+            domain = [('rental_company_id', '=', self.id)]
+            context['default_rental_company_id'] = self.id
+        else:
+            domain = [('rental_company_id', 'in', self.ids)]
+        action = self.env['ir.actions.act_window']._for_xml_id('dbm.action_stock_lots_history')
+        action['domain'] = domain
+        action['context'] = context
         return action
 
     
@@ -3,6 +3,7 @@
 # See LICENSE and COPYRIGHT files for full copyright and licensing details.
 
 import logging
+import re
 
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError
@@ -10,48 +11,40 @@ from datetime import datetime, timedelta
 
 _logger = logging.getLogger(__name__)
 
+# Project code format XXXXX-YY (es. 00001-24)
+_PROJECT_CODE_RE = re.compile(r'\A\d{5}-\d{2}\Z')
+
 
 class Project(models.Model):
     _inherit = "project.project"
+
+    _sql_constraints = [
+        ('code_uniq', 'unique(code)', 'A project with this code already exists. Please use a unique project code.'),
+    ]
     
     # Custom fields for CSV import
     code = fields.Char(
         string="Codice Progetto",
         help="Unique project code from CSV import",
-        index=True
+        index='trigram'
     )
     
     cig = fields.Char(
         string="CIG",
-        help="Codice Identificativo Gara"
+        help="Codice Identificativo Gara",
+        index='trigram'
     )
     
     cup = fields.Char(
         string="CUP",
-        help="Codice Unico di Progetto"
+        help="Codice Unico di Progetto",
+        index='trigram'
     )
     
     type_dbm = fields.Char(
         string="Tipologia",
         help="Project type from CSV import"
     )
-    
-    @api.constrains('code')
-    def _check_project_code_unique(self):
-        """
-        Ensure project code is unique across all projects
-        """
-        for record in self:
-            if record.code:
-                existing = self.search([
-                    ('code', '=', record.code),
-                    ('id', '!=', record.id)
-                ])
-                if existing:
-                    raise ValidationError(
-                        f"Project with code '{record.code}' already exists. "
-                        f"Please use a unique project code."
-                    )
 
 
 class ProjectTask(models.Model):
@@ -61,7 +54,7 @@ class ProjectTask(models.Model):
     project_code = fields.Char(
         string="Codice Commessa",
         help="Codice commessa/progetto (formato XXXXX-YY)",
-        index=True
+        index='btree_not_null'
     )
     
     partner_ref_id = fields.Many2one(
@@ -73,21 +66,26 @@ class ProjectTask(models.Model):
 
     planned_date_start = fields.Datetime(string="Data pianificata")
     
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """Override create to handle project lookup by code"""
-        if 'project_code' in vals and vals.get('project_code'):
-            # Try to find project by code
-            project = self.env['project.project'].search([
-                ('code', '=', vals['project_code'])
-            ], limit=1)
-            if project:
-                vals['project_id'] = project.id
-                _logger.info(f"Found project by code {vals['project_code']}: {project.name}")
-            else:
-                _logger.warning(f"Project with code {vals['project_code']} not found")
+        codes = {vals['project_code'] for vals in vals_list if vals.get('project_code')}
+        if codes:
+            # Resolve all project codes of the batch with a single query
+            projects = self.env['project.project'].search_fetch([
+                ('code', 'in', list(codes))
+            ], ['code', 'name'])
+            code2project = {project.code: project for project in projects}
+            missing = codes - set(code2project)
+            if missing:
+                _logger.warning("Projects not found for codes: %s", sorted(missing))
+            for vals in vals_list:
+                project = code2project.get(vals.get('project_code'))
+                if project:
+                    vals['project_id'] = project.id
+                    _logger.debug("Found project by code %s: %s", vals['project_code'], project.name)
         
-        return super().create(vals)
+        return super().create(vals_list)
 
     def write(self, vals):
         return super().write(vals)
@@ -95,12 +93,13 @@ class ProjectTask(models.Model):
     @api.constrains('project_code')
     def _check_project_code_format(self):
         """Validate project code format (XXXXX-YY)"""
-        for record in self:
-            if record.project_code:
-                import re
-                pattern = r'^\d{5}-\d{2}$'
-                if not re.match(pattern, record.project_code):
-                    raise ValidationError(
-                        f"Formato codice commessa non valido: {record.project_code}. "
-                        f"Formato atteso: XXXXX-YY (es. 00001-24)"
-                    )
+        self.fetch(['project_code'])
+        invalid_codes = [
+            code for code in self.mapped('project_code')
+            if code and not _PROJECT_CODE_RE.match(code)
+        ]
+        if invalid_codes:
+            raise ValidationError(
+                f"Formato codice commessa non valido: {', '.join(invalid_codes)}. "
+                f"Formato atteso: XXXXX-YY (es. 00001-24)"
+            )
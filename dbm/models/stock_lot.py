@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from odoo import models, fields, api
+from odoo.tools.sql import create_index
 
 
 class StockLot(models.Model):
@@ -9,25 +10,27 @@ class StockLot(models.Model):
     # Custom fields for DBM import
     manufacturer_lot = fields.Char(
         string='Matricola Produttore',
-        help='Manufacturer lot/serial number'
+        help='Manufacturer lot/serial number',
+        index='trigram'
     )
     
     customer_lot = fields.Char(
         string='Matricola Cliente', 
-        help='Customer lot/serial number'
+        help='Customer lot/serial number',
+        index='trigram'
     )
     
-    labor_warranty = fields.Datetime(
+    labor_warranty = fields.Date(
         string='Garanzia Manodopera',
         help='Labor warranty expiration date'
     )
     
-    parts_warranty = fields.Datetime(
+    parts_warranty = fields.Date(
         string='Garanzia Ricambi',
         help='Parts warranty expiration date'
     )
     
-    onsite_warranty = fields.Datetime(
+    onsite_warranty = fields.Date(
         string='Garanzia On Site',
         help='On-site warranty expiration date'
     )
@@ -44,3 +47,17 @@ class StockLot(models.Model):
         ('tested', 'Collaudato'),
         ('pending', 'In Attesa'),
     ], string='Collaudo', default='not_tested', help='Testing status')
+
+    def init(self):
+        super().init()
+        # Warranty expiry lookups are usually scoped to a rental company;
+        # the leading column also serves the partner lot history action
+        create_index(
+            self.env.cr, 'stock_lot_rental_warranty_idx', self._table,
+            ['rental_company_id', 'labor_warranty'],
+        )
+        # Only a small share of lots waits for testing
+        create_index(
+            self.env.cr, 'stock_lot_pending_test_idx', self._table,
+            ['testing_status'], where="testing_status = 'pending'",
+        )
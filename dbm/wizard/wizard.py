@@ -2,14 +2,241 @@
 import logging
 import csv
 import base64
+import codecs
 import io
+import re
+from functools import lru_cache
+from collections import defaultdict
 
-from odoo import models, fields, api
+import pytz
+from psycopg2.extras import execute_values
+
+from odoo import models, fields, api, tools
 from odoo.exceptions import ValidationError, UserError
+from odoo.osv import expression
 from datetime import datetime, timedelta
 
 _logger = logging.getLogger(__name__)
 
+# Bulk imports must not log chatter messages, subscribe followers or track values
+_IMPORT_CONTEXT = {
+    'tracking_disable': True,
+    'mail_create_nolog': True,
+    'mail_create_nosubscribe': True,
+    'mail_notrack': True,
+}
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Italian postal code (CAP) format: exactly 5 ASCII digits
+_ZIP_RE = re.compile(r'\A[0-9]{5}\Z')
+
+# Separators dropped from phone numbers and VAT codes before storing/validating them
+_PHONE_STRIP = str.maketrans('', '', ' -/()')
+_VAT_STRIP = str.maketrans('', '', ' .-')
+
+# Plain text -> HTML translation of the ticket descriptions, same escaping as html.escape()
+_HTML_TEXT_MAP = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+    '\n': '<br/>',
+})
+
+# Texts of the result note and notification of the _import_csv based imports
+_CSV_IMPORT_LABELS = {
+    'partners': {
+        'record': "Partner",
+        'summary': "Import completed:",
+        'created': "Partner creati",
+        'updated': "Partner aggiornati",
+        'more_created': "e altri {} partner creati",
+        'more_updated': "e altri {} partner aggiornati",
+        'notification': "Import Completato",
+    },
+    'persons': {
+        'record': "Person",
+        'summary': "Import persone completato:",
+        'created': "Persone create",
+        'updated': "Persone aggiornate",
+        'more_created': "e altre {} persone create",
+        'more_updated': "e altre {} persone aggiornate",
+        'notification': "Import Persone Completato",
+    },
+}
+
+# Wizard delimiter selection -> CSV delimiter character
+_DELIMITER_MAP = {
+    'comma': ',',
+    'semicolon': ';',
+    'tab': '\t',
+}
+
+# Byte order marks identifying the encoding of an upload
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+# Bytes inspected to detect the encoding of an upload
+_ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Characters inspected to check the selected delimiter of an upload
+_DELIMITER_SAMPLE_SIZE = 64 * 1024
+
+# Number of records written per transaction by the batched imports
+_IMPORT_BATCH_SIZE = 1000
+
+# Records listed by name in the import result note
+_RESULT_PREVIEW_SIZE = 10
+
+# Date formats found in the CSV exports
+_DATE_FORMATS = (
+    '%d/%m/%Y %H:%M',      # 31/03/2024 1:00
+    '%d/%m/%Y %H:%M:%S',   # 31/03/2024 1:00:00
+    '%d/%m/%Y',            # 31/03/2024
+    '%Y-%m-%d %H:%M:%S',   # 2024-03-31 01:00:00
+    '%Y-%m-%d %H:%M',      # 2024-03-31 01:00
+    '%Y-%m-%d',            # 2024-03-31
+    '%d-%m-%Y %H:%M',      # 31-03-2024 1:00
+    '%d-%m-%Y',            # 31-03-2024
+)
+
+
+# Day first dates of the CSV exports (31/03/2024, 31-03-2024 1:00, 31/03/2024 1:00:00)
+_DAY_FIRST_DATE_RE = re.compile(r'\A(\d{1,2})([/-])(\d{1,2})\2(\d{4})(?: (\d{1,2}):(\d{2})(?::(\d{2}))?)?\Z')
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_string):
+    """
+    Parse a CSV date with the supported formats. Day first dates are split by
+    a single regex and built directly, ISO dates go through the C
+    datetime.fromisoformat; strptime over _DATE_FORMATS is only the fallback
+    for values of neither shape. Results are memoized since date columns
+    repeat the same values a lot.
+    Returns a naive datetime, or None if no format matches.
+    """
+    match = _DAY_FIRST_DATE_RE.match(date_string)
+    if match:
+        day, month, year, hour, minute, second = match.group(1, 3, 4, 5, 6, 7)
+        try:
+            return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0))
+        except ValueError:
+            return None  # Out of range (31/02/2024), no other format can match it
+    
+    if date_string[4:5] == '-':
+        try:
+            parsed_date = datetime.fromisoformat(date_string)
+            if not parsed_date.tzinfo:
+                return parsed_date
+        except ValueError:
+            pass
+    
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_string, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def _like_escape(value):
+    """
+    Escape the LIKE wildcards of value, to match it literally with =like/=ilike
+    """
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+# CSV 'Fatta/da fare' values -> project.task.type names, other values are used as is
+_ACTIVITY_STAGE_MAP = {
+    'ANNULLATA': 'Annullata',
+    'TO DO': 'Attività da fare',
+    'COMPLETED': 'Attività fatta',
+}
+
+# Mappa standardizzata per le fasi progetto: CSV 'Stato' -> project.project.stage names.
+# Se arriva per esempio "In Progress" o "Closed", mappali su quelli esistenti,
+# se non è nella mappa si usa il valore originale come nome stage.
+_PROJECT_STAGE_MAP = {
+    'DA FARE': 'Da fare',
+    'TO DO': 'Da fare',
+    'IN CORSO': 'In corso',
+    'IN PROGRESS': 'In corso',
+    'COMPLETATO': 'Completato',
+    'COMPLETED': 'Completato',
+    'CHIUSO': 'Completato',
+    'ANNULLATO': 'Annullato',
+    'CANCELLED': 'Annullato',
+    'CANCELED': 'Annullato',
+}
+
+# CSV project 'Priorità' values -> project priority keys, medium ('0') for other values
+_PROJECT_PRIORITY_MAP = {
+    'ALTA': '1',
+    'MEDIA': '0',
+    'BASSA': '-1',
+}
+
+# CSV ticket 'Stato' values -> helpdesk.ticket.stage names, other values are used as is
+_TICKET_STAGE_MAP = {
+    'APERTO': 'Nuovo',
+    'IN CORSO': 'In corso',
+    'IN ATTESA': 'In attesa',
+    'CHIUSO - OK': 'Fatto',
+    'CHIUSO - KO': 'Respinto',
+    'ANNULLATO': 'Annullato',
+    'PIANIFICAZIONE': 'Nuovo',  # Map to Nuovo for planning stage
+    'SOSPESO': 'In attesa',  # Map to In attesa for suspended
+}
+
+# CSV columns -> project.task fields of the activity import
+_ACTIVITY_FIELD_MAPPING = {
+    'Attività': 'name',
+    'Azienda': 'partner_id',
+    'In carico a': 'user_ids',
+    'Data': 'planned_date_start',
+    'Fatta/da fare': 'stage_id',
+    'Macro tipo': 'tag_ids',
+    'Commessa': 'project_id',
+    'Descrizione attività': 'description',
+    'Tipo attività': 'tag_ids',
+    'Referente': 'partner_ref_id',
+}
+
+# CSV columns -> helpdesk.ticket fields of the helpdesk ticket import
+_HELPDESK_FIELD_MAPPING = {
+    'Oggetto': 'name',
+    'Codice': 'number',
+    'Proprietario': 'user_id',
+    'Cliente': 'partner_id',
+    'Descrizione': 'description',
+    'Stato': 'stage_id',
+    'Data inizio effettiva': 'assigned_date',
+    'Data creazione': 'create_date',
+    'Data Pianificazione': 'planned_date',
+}
+
+# Columns written by the helpdesk ticket bulk insert, see _helpdesk_ticket_values
+_TICKET_COLUMNS = (
+    'name', 'description', 'user_id', 'stage_id', 'active', 'company_id',
+    'create_uid', 'create_date', 'write_uid', 'write_date', 'number',
+    'partner_id', 'partner_name', 'assigned_date', 'closed_date', 'last_stage_update',
+)
+_TICKET_INSERT_SQL = f"INSERT INTO helpdesk_ticket ({', '.join(_TICKET_COLUMNS)}) VALUES %s RETURNING id"
+
+# CSV 'Collaudo' values -> stock.lot testing_status selection keys
+_TESTING_STATUS_MAP = {
+    'collaudato': 'tested',
+    'tested': 'tested',
+    'in attesa': 'pending',
+    'pending': 'pending',
+    'non collaudato': 'not_tested',
+    'not tested': 'not_tested',
+}
+
 class DbmImportWizard(models.TransientModel):
     _name = "dbm.import.wizard"
     _description = "Import Wizard"
@@ -49,96 +276,193 @@ class DbmImportWizard(models.TransientModel):
 
     def _log_import_error(self, error_type, message, details=None, row_number=None, import_type=None):
         """
-        Log import errors to ir.logging table
+        Queue an import error for the ir.logging table. The queue belongs to the
+        import run (the wizard recordset running it) and is inserted with a single
+        create() by _flush_import_errors, which the imports call before each batch
+        commit and once at the end.
+        """
+        log_data = {
+            'name': f"DBM Import Error - {error_type}",
+            'level': 'ERROR',
+            'message': message,
+            'path': 'dbm.import.wizard',
+            'line': row_number or 0,
+            'func': f"_import_{import_type}" if import_type else "import_file",
+            'type': 'server',  # Add required type field
+            'create_date': fields.Datetime.now(),
+            'create_uid': self.env.user.id,
+        }
+        
+        # Add additional details if provided
+        if details:
+            log_data['message'] += f" | Details: {details}"
+        
+        self._import_log_entries().append(log_data)
+        _logger.info("Error queued for ir.logging: %s", message)
+
+    def _import_log_entries(self):
         """
+        Return the list of the import errors queued on this recordset
+        """
+        pending = getattr(self, '_pending_import_log', None)
+        if pending is None:
+            pending = self._pending_import_log = []
+        return pending
+
+    def _flush_import_errors(self):
+        """
+        Insert the queued import errors in ir.logging with a single create()
+        """
+        pending = self._import_log_entries()
+        if not pending:
+            return
         try:
-            log_data = {
-                'name': f"DBM Import Error - {error_type}",
-                'level': 'ERROR',
-                'message': message,
-                'path': 'dbm.import.wizard',
-                'line': row_number or 0,
-                'func': f"_import_{import_type}" if import_type else "import_file",
-                'type': 'server',  # Add required type field
-                'create_date': fields.Datetime.now(),
-                'create_uid': self.env.user.id,
-            }
-            
-            # Add additional details if provided
-            if details:
-                log_data['message'] += f" | Details: {details}"
-            
-            # Create the log entry
-            self.env['ir.logging'].create(log_data)
-            _logger.info(f"Error logged to ir.logging: {message}")
-            
+            with self.env.cr.savepoint():
+                self.env['ir.logging'].create(pending)
         except Exception as e:
             # Fallback to standard logging if ir.logging fails
-            _logger.error(f"Failed to log to ir.logging: {str(e)} | Original error: {message}")
+            for log_data in pending:
+                _logger.error("Failed to log to ir.logging: %s | Original error: %s", e, log_data['message'])
+        pending.clear()
 
-    def _test_date_parsing(self, date_string):
+    @tools.ormcache('module_name')
+    def _is_module_installed(self, module_name):
         """
-        Test function to verify date parsing works correctly
+        Check whether a module is installed. Cached in the registry, which is
+        reloaded (and the cache cleared) whenever modules are installed or removed.
         """
-        date_formats = [
-            '%d/%m/%Y %H:%M',      # 31/03/2024 1:00
-            '%d/%m/%Y %H:%M:%S',   # 31/03/2024 1:00:00
-            '%d/%m/%Y',            # 31/03/2024
-            '%Y-%m-%d %H:%M:%S',   # 2024-03-31 01:00:00
-            '%Y-%m-%d %H:%M',      # 2024-03-31 01:00
-            '%Y-%m-%d',            # 2024-03-31
-            '%d-%m-%Y %H:%M',      # 31-03-2024 1:00
-            '%d-%m-%Y',            # 31-03-2024
-        ]
-        
-        for date_format in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_string, date_format)
-                result = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
-                _logger.info(f"Date '{date_string}' parsed successfully with format '{date_format}' -> '{result}'")
-                return result
-            except ValueError:
-                continue
+        return bool(self.env['ir.module.module'].sudo().search_count([('name', '=', module_name), ('state', '=', 'installed')], limit=1))
+
+    def _open_csv_text(self, file_content):
+        """
+        Return a text stream over the uploaded CSV bytes, decoded with the selected
+        encoding or a detected one in auto mode. The content is decoded while the CSV
+        reader consumes it, so the whole file is never held as a decoded string.
+        """
+        encoding, errors = self._csv_encoding(file_content)
+        return io.TextIOWrapper(io.BytesIO(file_content), encoding=encoding, errors=errors, newline='')
+
+    def _csv_delimiter(self, csv_file, delimiter):
+        """
+        Check the selected delimiter on a sample of the CSV text stream, which is
+        rewound afterwards. When it does not occur in the header line, the file would
+        be parsed as a single column: use the delimiter csv.Sniffer finds instead.
+        """
+        sample = csv_file.read(_DELIMITER_SAMPLE_SIZE)
+        csv_file.seek(0)
+        if delimiter in sample.partition('\n')[0]:
+            return delimiter
+        try:
+            guessed = csv.Sniffer().sniff(sample, delimiters=''.join(_DELIMITER_MAP.values())).delimiter
+        except csv.Error:
+            _logger.warning("Delimiter %r not found in the CSV header and none could be detected", delimiter)
+            return delimiter
+        _logger.warning("Delimiter %r not found in the CSV header, using detected delimiter %r", delimiter, guessed)
+        return guessed
+
+    def _csv_encoding(self, file_content):
+        """
+        Return the (encoding, errors) pair to decode the uploaded bytes with: the selected
+        encoding, decoded strictly, or in auto mode a detected one, decoded leniently
+        so that reading can never fail half way
+        """
+        if self.file_encoding != 'auto':
+            # Use user-selected encoding
+            _logger.info("Reading file using user-selected encoding: %s", self.file_encoding)
+            return self.file_encoding, 'strict'
         
-        _logger.warning(f"Unable to parse date '{date_string}' with any supported format")
-        return None
+        encoding = self._sniff_encoding(file_content)
+        _logger.info("Detected file encoding: %s", encoding)
+        return encoding, 'replace'
 
-    def _test_project_creation(self):
+    def _sniff_encoding(self, file_content):
         """
-        Test function to verify project creation works
+        Guess the encoding of the uploaded bytes: byte order mark first, then UTF-8
+        if the head of the file is valid UTF-8 and Windows-1252 (the usual Italian
+        Windows export) otherwise, the only encodings the exports come in.
+        Only the first _ENCODING_SAMPLE_SIZE bytes are inspected.
         """
+        for bom, encoding in _BOM_ENCODINGS:
+            if file_content.startswith(bom):
+                return encoding
+        
         try:
-            _logger.info("Testing project creation...")
-            
-            # Check if project module is installed
-            project_module = self.env['ir.module.module'].search([('name', '=', 'project'), ('state', '=', 'installed')])
-            if not project_module:
-                _logger.error("Project module is not installed")
-                return False
-            
-            # Try to create a simple test project
-            test_data = {
-                'name': 'Test Project - DBM Import',
-                'code': 'TEST-DBM-001',
-                'type_dbm': 'GENERICO'
-            }
-            
-            _logger.info(f"Creating test project with data: {test_data}")
-            test_project = self.env['project.project'].create(test_data)
-            
-            if test_project.exists():
-                _logger.info(f"Test project created successfully - ID: {test_project.id}")
-                # Clean up - delete the test project
-                test_project.unlink()
-                _logger.info("Test project deleted successfully")
-                return True
-            else:
-                _logger.error("Test project creation failed")
-                return False
-                
-        except Exception as e:
-            _logger.error(f"Test project creation failed with error: {str(e)}")
-            return False
+            # Incremental decoding tolerates a multi-byte character cut at the end of the sample
+            codecs.getincrementaldecoder('utf-8')().decode(file_content[:_ENCODING_SAMPLE_SIZE])
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return 'cp1252'
+
+    def _result_section(self, title, items, total, more_label):
+        """
+        Lines of an import result section: the first _RESULT_PREVIEW_SIZE items and,
+        when there are more, a "... e altri N" tail built from more_label
+        """
+        if not total:
+            return []
+        lines = ["", f"{title}:"]
+        lines += [f"- {item}" for item in items[:_RESULT_PREVIEW_SIZE]]
+        if total > _RESULT_PREVIEW_SIZE:
+            lines.append(f"... {more_label.format(total - _RESULT_PREVIEW_SIZE)}")
+        return lines
+
+    def _csv_index_map(self, header, field_mapping):
+        """
+        Resolve field_mapping against the CSV header once
+        Returns (column index, csv field, odoo field) tuples for the mapped columns present in the file
+        """
+        column_index = {}
+        for i, column in enumerate(header):
+            column_index.setdefault(column, i)
+        return [
+            (column_index[csv_field], csv_field, odoo_field)
+            for csv_field, odoo_field in field_mapping.items()
+            if csv_field in column_index
+        ]
+
+    def _csv_row_values(self, row, idx_map):
+        """
+        Return (csv field, odoo field, stripped value) for the non-empty mapped cells of a CSV row
+        """
+        row_len = len(row)
+        values = []
+        for i, csv_field, odoo_field in idx_map:
+            if i < row_len:
+                value = row[i].strip()
+                if value:
+                    values.append((csv_field, odoo_field, value))
+        return values
+
+    def _csv_column_getter(self, header, column):
+        """
+        Return a function reading the stripped value of a named column ('' if absent) from positional CSV rows
+        """
+        if column not in header:
+            return lambda row: ''
+        i = header.index(column)
+        return lambda row: row[i].strip() if i < len(row) else ''
+
+    def _csv_cell_getter(self, header, column, default='N/A'):
+        """
+        Return a function reading the raw value of a named column (default if absent) from positional CSV rows
+        """
+        if column not in header:
+            return lambda row: default
+        i = header.index(column)
+        return lambda row: row[i] if i < len(row) else default
+
+    def _test_date_parsing(self, date_string):
+        """
+        Test function to verify date parsing works correctly
+        """
+        parsed_date = _parse_date(date_string)
+        if parsed_date:
+            result = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
+            _logger.info("Date '%s' parsed successfully -> '%s'", date_string, result)
+            return result
+        
+        _logger.warning("Unable to parse date '%s' with any supported format", date_string)
+        return None
 
     @api.model
     def import_file(self, file_data, import_type):
@@ -148,6 +472,10 @@ class DbmImportWizard(models.TransientModel):
         if not file_data:
             raise UserError("No file provided for import")
         
+        # Also when called directly instead of through action_import_file
+        self = self.with_context(**_IMPORT_CONTEXT)
+        # Import errors of this run, queued by _log_import_error
+        self._pending_import_log = []
         if import_type == "partner":
             return self._import_partners(file_data)
         elif import_type == "person":
@@ -163,10 +491,15 @@ class DbmImportWizard(models.TransientModel):
         else:
             raise UserError(f"Import type '{import_type}' not supported")
 
-    def _import_partners(self, file_data):
+    def _import_csv(self, file_data, field_mapping, import_type, process_rows):
         """
-        Import partners from CSV file
+        Shared scaffolding of the CSV imports: decode and parse the file, hand the rows to
+        process_rows(rows, header, idx_map, report) and turn the report into the result
+        note and notification. rows yields (row number, row) tuples, report is filled
+        through _report_record and _report_row_error.
         """
+        labels = _CSV_IMPORT_LABELS[import_type]
+        
         # Start a new transaction for this import
         self.env.cr.commit()  # Commit any pending changes
         
@@ -175,144 +508,54 @@ class DbmImportWizard(models.TransientModel):
             file_content = base64.b64decode(file_data)
             
             # Get delimiter
-            delimiter_map = {
-                'comma': ',',
-                'semicolon': ';',
-                'tab': '\t'
-            }
-            delimiter = delimiter_map.get(self.delimiter, ',')
-            
-            # Handle file encoding
-            if self.file_encoding == 'auto':
-                # Try different encodings to handle various file formats
-                encodings_to_try = ['utf-8', 'utf-8-sig', 'cp1252', 'iso-8859-1', 'latin1']
-                csv_content = None
-                
-                for encoding in encodings_to_try:
-                    try:
-                        csv_content = file_content.decode(encoding)
-                        _logger.info(f"Successfully decoded file using encoding: {encoding}")
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if csv_content is None:
-                    raise UserError("Unable to decode the file. Please try selecting a specific encoding or save the file with UTF-8 encoding.")
-            else:
-                # Use user-selected encoding
-                try:
-                    csv_content = file_content.decode(self.file_encoding)
-                    _logger.info(f"Successfully decoded file using user-selected encoding: {self.file_encoding}")
-                except UnicodeDecodeError as e:
-                    raise UserError(f"Unable to decode the file using {self.file_encoding} encoding. Error: {str(e)}")
-            
-            # Parse CSV
-            csv_file = io.StringIO(csv_content)
-            reader = csv.DictReader(csv_file, delimiter=delimiter)
-            
-            # Field mapping for CSV columns to Odoo fields
-            field_mapping = {
-                'Codice': 'ref',
-                'Nome Completo': 'name',
-                'Indirizzo': 'street',
-                'CAP': 'zip',
-                'Città': 'city',
-                'Prov.': 'state_id',
-                'NAZIONE': 'country_id',
-                'Partita IVA': 'vat',
-                'Codice fiscale': 'l10n_it_codice_fiscale',
-                'Num.tel.1': 'phone',
-                'Cell.': 'mobile',
-                'E-mail': 'email',
-                'Internet': 'website',
-                'Num.tel.2': 'comment',
-                'Fax': 'comment'
+            delimiter = _DELIMITER_MAP.get(self.delimiter, ',')
+            
+            # Parse CSV, decoding lines lazily while reading
+            csv_file = self._open_csv_text(file_content)
+            delimiter = self._csv_delimiter(csv_file, delimiter)
+            reader = csv.reader(csv_file, delimiter=delimiter)
+            header = next(reader, [])
+            idx_map = self._csv_index_map(header, field_mapping)
+            
+            report = {
+                'created_count': 0,
+                'updated_count': 0,
+                'error_count': 0,
+                'created': [],
+                'updated': [],
+                'errors': [],
+                'summary_lines': [],
             }
-            
-            created_count = 0
-            updated_count = 0
-            error_count = 0
-            errors = []
-            created_partners = []
-            updated_partners = []
-            
-            for row_num, row in enumerate(reader, start=2):  # Start from 2 if header exists
-                try:
-                    
-                    partner_data = self._prepare_partner_data(row, field_mapping)
-                    if partner_data:
-                        result = self._create_or_update_partner(partner_data)
-                        if result['action'] == 'created':
-                            created_count += 1
-                            created_partners.append(f"{partner_data.get('name', 'N/A')} (Codice: {partner_data.get('ref', 'N/A')})")
-                        elif result['action'] == 'updated':
-                            updated_count += 1
-                            updated_partners.append(f"{partner_data.get('name', 'N/A')} (Codice: {partner_data.get('ref', 'N/A')})")
-                    
-                    
-                except Exception as e:
-                    error_count += 1
-                    partner_name = row.get('Nome Completo', 'N/A')
-                    partner_code = row.get('Codice', 'N/A')
-                    error_msg = f"Row {row_num} - {partner_name} (Codice: {partner_code}): {str(e)}"
-                    errors.append(error_msg)
-                    
-                    # Log error to ir.logging
-                    self._log_import_error(
-                        error_type="Partner Import Row Error",
-                        message=error_msg,
-                        details=f"Partner: {partner_name}, Code: {partner_code}",
-                        row_number=row_num,
-                        import_type="partners"
-                    )
-                    
-                    _logger.error(f"Error importing partner at row {row_num}: {str(e)}")
-
-                    continue
+            process_rows(enumerate(reader, start=2), header, idx_map, report)  # Start from 2 if header exists
             
             # Update note with detailed results
-            result_message = f"Import completed:\n"
-            result_message += f"- Partner creati: {created_count}\n"
-            result_message += f"- Partner aggiornati: {updated_count}\n"
-            result_message += f"- Errori: {error_count}\n"
-            
-            # Show created partners
-            if created_partners:
-                result_message += f"\nPartner creati:\n"
-                for partner in created_partners[:10]:  # Show first 10
-                    result_message += f"- {partner}\n"
-                if len(created_partners) > 10:
-                    result_message += f"... e altri {len(created_partners) - 10} partner creati\n"
-            
-            # Show updated partners
-            if updated_partners:
-                result_message += f"\nPartner aggiornati:\n"
-                for partner in updated_partners[:10]:  # Show first 10
-                    result_message += f"- {partner}\n"
-                if len(updated_partners) > 10:
-                    result_message += f"... e altri {len(updated_partners) - 10} partner aggiornati\n"
-            
-            # Show errors
-            if errors:
-                result_message += f"\nErrori riscontrati:\n"
-                for error in errors[:10]:  # Show first 10 errors
-                    result_message += f"- {error}\n"
-                if len(errors) > 10:
-                    result_message += f"... e altri {len(errors) - 10} errori\n"
-            
-            self.note = result_message
+            created_count = report['created_count']
+            updated_count = report['updated_count']
+            error_count = report['error_count']
+            result_lines = [
+                labels['summary'],
+                f"- {labels['created']}: {created_count}",
+                f"- {labels['updated']}: {updated_count}",
+                *report['summary_lines'],
+                f"- Errori: {error_count}",
+            ]
+            result_lines += self._result_section(labels['created'], report['created'], created_count, labels['more_created'])
+            result_lines += self._result_section(labels['updated'], report['updated'], updated_count, labels['more_updated'])
+            result_lines += self._result_section("Errori riscontrati", report['errors'], error_count, "e altri {} errori")
+            self.note = "\n".join(result_lines) + "\n"
             
             # Prepare notification message
-            total_processed = created_count + updated_count
             notification_msg = f"Creati: {created_count}, Aggiornati: {updated_count}"
             if error_count > 0:
                 notification_msg += f", Errori: {error_count}"
             
+            self._flush_import_errors()
+            
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
                 'params': {
-                    'title': 'Import Completato',
+                    'title': labels['notification'],
                     'message': notification_msg,
                     'type': 'success' if error_count == 0 else 'warning',
                 }
@@ -324,233 +567,270 @@ class DbmImportWizard(models.TransientModel):
             
             # Log critical error to ir.logging
             self._log_import_error(
-                error_type="Partner Import Critical Error",
+                error_type=f"{labels['record']} Import Critical Error",
                 message=error_msg,
                 details=f"File processing failed completely",
-                import_type="partners"
+                import_type=import_type
             )
             
             _logger.error(error_msg)
             raise UserError(error_msg)
 
+    def _report_record(self, report, action, label):
+        """
+        Count a created or updated record in an import report, keeping its label for the preview
+        """
+        report[f'{action}_count'] += 1
+        if len(report[action]) < _RESULT_PREVIEW_SIZE:
+            report[action].append(label)
+
+    def _report_row_error(self, report, import_type, error_type, row_num, error_msg, details, error):
+        """
+        Count a failed CSV row in an import report and log it to ir.logging
+        """
+        report['error_count'] += 1
+        report['errors'].append(error_msg)
+        
+        # Log error to ir.logging
+        self._log_import_error(
+            error_type=error_type,
+            message=error_msg,
+            details=details,
+            row_number=row_num,
+            import_type=import_type
+        )
+        
+        _logger.error("Error importing %s at row %s: %s", import_type, row_num, error)
+
+    def _import_partners(self, file_data):
+        """
+        Import partners from CSV file
+        """
+        # Field mapping for CSV columns to Odoo fields
+        field_mapping = {
+            'Codice': 'ref',
+            'Nome Completo': 'name',
+            'Indirizzo': 'street',
+            'CAP': 'zip',
+            'Città': 'city',
+            'Prov.': 'state_id',
+            'NAZIONE': 'country_id',
+            'Partita IVA': 'vat',
+            'Codice fiscale': 'l10n_it_codice_fiscale',
+            'Num.tel.1': 'phone',
+            'Cell.': 'mobile',
+            'E-mail': 'email',
+            'Internet': 'website',
+            'Num.tel.2': 'comment',
+            'Fax': 'comment'
+        }
+        return self._import_csv(file_data, field_mapping, 'partners', self._process_partner_rows)
+
+    def _process_partner_rows(self, rows, header, idx_map, report):
+        """
+        Create or update a partner for each CSV row
+        """
+        # Countries and states are few, resolve them from memory instead of one search per row.
+        # They are plain reference data, read with SQL to skip the ORM overhead.
+        # state_by_country[False] holds the first state found for a code in any country.
+        self.env['res.country'].flush_model(['code'])
+        self.env['res.country.state'].flush_model(['code', 'country_id'])
+        self.env.cr.execute("SELECT code, id FROM res_country WHERE code IS NOT NULL")
+        country_by_code = dict(self.env.cr.fetchall())
+        state_by_country = defaultdict(dict)
+        self.env.cr.execute("SELECT id, code, country_id FROM res_country_state ORDER BY country_id, id")
+        for state_id, code, country_id in self.env.cr.fetchall():
+            state_by_country[country_id].setdefault(code, state_id)
+            state_by_country[False].setdefault(code, state_id)
+        
+        # Exports repeat a partner on sub-rows: keep only the last row of each codice.
+        # Rows without codice are all kept, they are reported as errors below.
+        code_col = header.index('Codice') if 'Codice' in header else None
+        rows_by_code = {}
+        total_rows = 0
+        for row_num, row in rows:
+            total_rows += 1
+            code = row[code_col].strip() if code_col is not None and code_col < len(row) else ''
+            rows_by_code[code or row_num] = (row_num, row)
+        duplicates_in_file = total_rows - len(rows_by_code)
+        if duplicates_in_file:
+            _logger.info("Skipping %s duplicate partner rows (same Codice) in file", duplicates_in_file)
+        report['summary_lines'].append(f"- Righe duplicate nel file (stesso Codice): {duplicates_in_file}")
+        
+        # Existing partners with the codici of the file, fetched with one query so matching a row costs none
+        refs = [code for code in rows_by_code if isinstance(code, str)]
+        self.env['res.partner'].flush_model(['ref'])
+        self.env.cr.execute("SELECT ref, id FROM res_partner WHERE ref = ANY(%s)", (refs,))
+        partner_index = dict(self.env.cr.fetchall())
+        
+        partner_name_cell = self._csv_cell_getter(header, 'Nome Completo')
+        partner_code_cell = self._csv_cell_getter(header, 'Codice')
+        # Rows are only prepared and queued here, partners are written in bulk after the CSV pass
+        pending_creates = {}
+        pending_updates = {}
+        for row_num, row in rows_by_code.values():
+            try:
+                partner_data = self._prepare_partner_data(row, idx_map, country_by_code, state_by_country)
+                if partner_data:
+                    self._queue_partner(partner_data, row_num, partner_index, pending_creates, pending_updates)
+                
+            except Exception as e:
+                partner_name = partner_name_cell(row)
+                partner_code = partner_code_cell(row)
+                self._report_row_error(
+                    report, 'partners', "Partner Import Row Error", row_num,
+                    f"Row {row_num} - {partner_name} (Codice: {partner_code}): {str(e)}",
+                    f"Partner: {partner_name}, Code: {partner_code}",
+                    e,
+                )
+        
+        created, updated, batch_errors = self._apply_partner_batch(pending_creates, pending_updates)
+        for action, entries in (('created', created), ('updated', updated)):
+            for entry in entries:
+                self._report_record(report, action, f"{entry['vals'].get('name', 'N/A')} (Codice: {entry['vals'].get('ref', 'N/A')})")
+        for entry, e in batch_errors:
+            self._report_row_error(
+                report, 'partners', "Partner Create/Update Error", entry['row'],
+                f"Row {entry['row']} - {entry['vals'].get('name', 'N/A')} (Codice: {entry['vals'].get('ref', 'N/A')}): {str(e)}",
+                f"Partner data: {entry['vals']}",
+                e,
+            )
+
     def _import_persons(self, file_data):
         """
         Import persons from CSV file - these are people associated with companies
         """
-        # Start a new transaction for this import
-        self.env.cr.commit()
+        # Field mapping for CSV columns to Odoo fields
+        field_mapping = {
+            'Azienda': 'parent_company',
+            'Referenti': 'name',
+            'E-mail': 'email',
+            'Cellulare 1': 'mobile',
+            'Telefono 1': 'phone',
+            'Note': 'comment',
+            'Codice': 'ref',
+            'Partita IVA': 'vat',
+        }
+        return self._import_csv(file_data, field_mapping, 'persons', self._process_person_rows)
+
+    def _process_person_rows(self, rows, header, idx_map, report):
+        """
+        Queue a person for each CSV row, then write them in bulk
+        """
+        # Index existing companies by normalized name once, instead of
+        # searching res.partner for every row
+        company_index = {}
+        companies = self.env['res.partner'].search_read([('is_company', '=', True)], ['name'])
+        for company in companies:
+            company_index.setdefault((company['name'] or '').strip().lower(), (company['id'], company['name']))
         
-        try:
-            # Decode the file
-            file_content = base64.b64decode(file_data)
-            
-            # Get delimiter
-            delimiter_map = {
-                'comma': ',',
-                'semicolon': ';',
-                'tab': '\t'
-            }
-            delimiter = delimiter_map.get(self.delimiter, ',')
-            
-            # Handle file encoding
-            if self.file_encoding == 'auto':
-                # Try different encodings to handle various file formats
-                encodings_to_try = ['utf-8', 'utf-8-sig', 'cp1252', 'iso-8859-1', 'latin1']
-                csv_content = None
-                
-                for encoding in encodings_to_try:
-                    try:
-                        csv_content = file_content.decode(encoding)
-                        _logger.info(f"Successfully decoded file using encoding: {encoding}")
-                        break
-                    except UnicodeDecodeError:
-                        continue
+        # Index existing persons by (name, parent company id) once, instead of
+        # searching for every row. (name, None) matches the first person with
+        # that name whatever its company, for rows without a company.
+        # Only the persons named in the file are read.
+        rows = list(rows)
+        person_name = self._csv_column_getter(header, 'Referenti')
+        person_names = list({person_name(row) for row_num, row in rows} - {''})
+        person_index = {}
+        persons = self.env['res.partner'].search_read([('is_company', '=', False), ('name', 'in', person_names)], ['name', 'parent_id'])
+        for person in persons:
+            if person['parent_id']:
+                person_index.setdefault((person['name'], person['parent_id'][0]), person['id'])
+            person_index.setdefault((person['name'], None), person['id'])
+        
+        # Rows are only prepared and queued here, persons are written in bulk after the CSV pass
+        pending_creates = {}
+        pending_updates = {}
+        person_name_cell = self._csv_cell_getter(header, 'Referenti')
+        company_name_cell = self._csv_cell_getter(header, 'Azienda')
+        for row_num, row in rows:
+            try:
+                person_data = self._prepare_person_data(row, idx_map, company_index)
+                if person_data:
+                    self._queue_person(person_data, row_num, person_index, pending_creates, pending_updates)
                 
-                if csv_content is None:
-                    raise UserError("Unable to decode the file. Please try selecting a specific encoding or save the file with UTF-8 encoding.")
-            else:
-                # Use user-selected encoding
-                try:
-                    csv_content = file_content.decode(self.file_encoding)
-                    _logger.info(f"Successfully decoded file using user-selected encoding: {self.file_encoding}")
-                except UnicodeDecodeError as e:
-                    raise UserError(f"Unable to decode the file using {self.file_encoding} encoding. Error: {str(e)}")
-            
-            # Parse CSV
-            csv_file = io.StringIO(csv_content)
-            reader = csv.DictReader(csv_file, delimiter=delimiter)
-            
-            # Field mapping for CSV columns to Odoo fields
-            field_mapping = {
-                'Azienda': 'parent_company',
-                'Referenti': 'name',
-                'E-mail': 'email',
-                'Cellulare 1': 'mobile',
-                'Telefono 1': 'phone',
-                'Note': 'comment',
-                'Codice': 'ref',
-                'Partita IVA': 'vat',
-            }
-            
-            created_count = 0
-            updated_count = 0
-            error_count = 0
-            errors = []
-            created_persons = []
-            updated_persons = []
-            
-            for row_num, row in enumerate(reader, start=2):  # Start from 2 if header exists
-                try:
-                    person_data = self._prepare_person_data(row, field_mapping)
-                    if person_data:
-                        result = self._create_or_update_person(person_data)
-                        if result['action'] == 'created':
-                            created_count += 1
-                            created_persons.append(f"{person_data.get('name', 'N/A')})")
-                        elif result['action'] == 'updated':
-                            updated_count += 1
-                            updated_persons.append(f"{person_data.get('name', 'N/A')})")
-                    
-                except Exception as e:
-                    error_count += 1
-                    person_name = row.get('Referenti', 'N/A')
-                    company_name = row.get('Azienda', 'N/A')
-                    error_msg = f"Row {row_num} - {person_name} (Azienda: {company_name}): {str(e)}"
-                    errors.append(error_msg)
-                    
-                    # Log error to ir.logging
-                    self._log_import_error(
-                        error_type="Person Import Row Error",
-                        message=error_msg,
-                        details=f"Person: {person_name}, Company: {company_name}",
-                        row_number=row_num,
-                        import_type="persons"
-                    )
-                    
-                    _logger.error(f"Error importing person at row {row_num}: {str(e)}")
-
-                    continue
-            
-            # Update note with detailed results
-            result_message = f"Import persone completato:\n"
-            result_message += f"- Persone create: {created_count}\n"
-            result_message += f"- Persone aggiornate: {updated_count}\n"
-            result_message += f"- Errori: {error_count}\n"
-            
-            # Show created persons
-            if created_persons:
-                result_message += f"\nPersone create:\n"
-                for person in created_persons[:10]:  # Show first 10
-                    result_message += f"- {person}\n"
-                if len(created_persons) > 10:
-                    result_message += f"... e altre {len(created_persons) - 10} persone create\n"
-            
-            # Show updated persons
-            if updated_persons:
-                result_message += f"\nPersone aggiornate:\n"
-                for person in updated_persons[:10]:  # Show first 10
-                    result_message += f"- {person}\n"
-                if len(updated_persons) > 10:
-                    result_message += f"... e altre {len(updated_persons) - 10} persone aggiornate\n"
-            
-            # Show errors
-            if errors:
-                result_message += f"\nErrori riscontrati:\n"
-                for error in errors[:10]:  # Show first 10 errors
-                    result_message += f"- {error}\n"
-                if len(errors) > 10:
-                    result_message += f"... e altri {len(errors) - 10} errori\n"
-            
-            self.note = result_message
-            
-            # Prepare notification message
-            total_processed = created_count + updated_count
-            notification_msg = f"Creati: {created_count}, Aggiornati: {updated_count}"
-            if error_count > 0:
-                notification_msg += f", Errori: {error_count}"
-            
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': 'Import Persone Completato',
-                    'message': notification_msg,
-                    'type': 'success' if error_count == 0 else 'warning',
-                }
-            }
-            
-        except Exception as e:
-            # Rollback the entire transaction on critical error
-            error_msg = f"Error processing file: {str(e)}"
-            
-            # Log critical error to ir.logging
-            self._log_import_error(
-                error_type="Person Import Critical Error",
-                message=error_msg,
-                details=f"File processing failed completely",
-                import_type="persons"
+            except Exception as e:
+                person_name = person_name_cell(row)
+                company_name = company_name_cell(row)
+                self._report_row_error(
+                    report, 'persons', "Person Import Row Error", row_num,
+                    f"Row {row_num} - {person_name} (Azienda: {company_name}): {str(e)}",
+                    f"Person: {person_name}, Company: {company_name}",
+                    e,
+                )
+        
+        created, updated, batch_errors = self._apply_person_batch(pending_creates, pending_updates)
+        for action, entries in (('created', created), ('updated', updated)):
+            for entry in entries:
+                self._report_record(report, action, entry['vals'].get('name', 'N/A'))
+        for entry, e in batch_errors:
+            self._report_row_error(
+                report, 'persons', "Person Create/Update Error", entry['row'],
+                f"Row {entry['row']} - {entry['vals'].get('name', 'N/A')} (Azienda: {entry['company'] or 'N/A'}): {str(e)}",
+                f"Person data: {entry['vals']}",
+                e,
             )
-            
-            _logger.error(error_msg)
-            raise UserError(error_msg)
 
-    def _prepare_person_data(self, row, field_mapping):
+    def _prepare_person_data(self, row, idx_map, company_index):
         """
         Prepare person data from CSV row
+        company_index maps normalized company names to (id, name) and is
+        extended with the companies found or created along the import
         """
         person_data = {}
-        _logger.info(f"Preparing person data from row: {row}")
+        _logger.debug("Preparing person data from row: %s", row)
         
-        for csv_field, odoo_field in field_mapping.items():
-            if csv_field in row and row[csv_field].strip():
-                value = row[csv_field].strip()
-                
-                # Special handling for specific fields
-                if odoo_field == 'parent_company':
-                    # Find parent company by name
+        for csv_field, odoo_field, value in self._csv_row_values(row, idx_map):
+            # Special handling for specific fields
+            if odoo_field == 'parent_company':
+                # Find parent company by name
+                company_key = value.lower()
+                if company_key in company_index:
+                    company_id, company_name = company_index[company_key]
+                    _logger.debug("Found parent company: %s", company_name)
+                else:
+                    # No exact match, fall back to the partial name lookup
                     company = self.env['res.partner'].search([
                         ('name', 'ilike', value),
                         ('is_company', '=', True)
                     ], limit=1)
                     if company:
-                        person_data['parent_id'] = company.id
-                        person_data['parent_company_name'] = company.name
-                        _logger.info(f"Found parent company: {company.name}")
+                        _logger.debug("Found parent company: %s", company.name)
                     else:
-                        _logger.warning(f"Parent company '{value}' not found")
+                        _logger.warning("Parent company '%s' not found", value)
                         # Create a basic company if not found
                         company = self.env['res.partner'].create({
                             'name': value,
                             'is_company': True,
                             'company_type': 'company',
                         })
-                        person_data['parent_id'] = company.id
-                        person_data['parent_company_name'] = company.name
-                        _logger.info(f"Created new parent company: {company.name}")
-                        
-                elif odoo_field == 'email':
-                    # Validate email format
-                    import re
-                    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-                    if re.match(email_pattern, value):
-                        person_data[odoo_field] = value
-                    else:
-                        _logger.warning(f"Invalid email format: {value}")
-                        
-                elif odoo_field in ['mobile', 'phone']:
-                    # Clean phone number
-                    clean_phone = value.replace(' ', '').replace('-', '').replace('/', '').replace('(', '').replace(')', '')
-                    person_data[odoo_field] = clean_phone
+                        _logger.info("Created new parent company: %s", company.name)
+                    company_id, company_name = company.id, company.name
+                    company_index[company_key] = (company_id, company_name)
+                person_data['parent_id'] = company_id
+                person_data['parent_company_name'] = company_name
                     
-                elif odoo_field == 'vat':
-                    # Store VAT for later processing (same as contacts)
+            elif odoo_field == 'email':
+                # Validate email format
+                if _EMAIL_RE.match(value):
                     person_data[odoo_field] = value
-                    
                 else:
-                    person_data[odoo_field] = value
-        
+                    _logger.warning("Invalid email format: %s", value)
+                    
+            elif odoo_field in ['mobile', 'phone']:
+                # Clean phone number
+                clean_phone = value.translate(_PHONE_STRIP)
+                person_data[odoo_field] = clean_phone
+                
+            elif odoo_field == 'vat':
+                # Store VAT for later processing (same as contacts)
+                person_data[odoo_field] = value
+                
+            else:
+                person_data[odoo_field] = value
+    
         # Set default values and validate required fields
-        if 'name' not in person_data or not person_data['name'].strip():
+        if not person_data.get('name'):
             error_msg = "Person name (Referenti) is required"
             self._log_import_error(
                 error_type="Person Validation Error",
@@ -577,7 +857,7 @@ class DbmImportWizard(models.TransientModel):
         # If no parent company found, set to None instead of failing
         if 'parent_id' not in person_data:
             person_data['parent_id'] = None
-            _logger.warning(f"No parent company found for person: {person_data.get('name', 'N/A')}")
+            _logger.warning("No parent company found for person: %s", person_data.get('name', 'N/A'))
         
         # Set default comment if not provided
         if 'comment' not in person_data:
@@ -585,87 +865,127 @@ class DbmImportWizard(models.TransientModel):
         
         # Validate VAT format if provided (same as contacts)
         if 'vat' in person_data and person_data['vat']:
-            vat = person_data['vat'].replace(' ', '').replace('.', '').replace('-', '')
+            vat = person_data['vat'].translate(_VAT_STRIP)
             if not vat.isalnum() or len(vat) < 8:
-                _logger.warning(f"Invalid VAT format: {person_data['vat']}")
+                _logger.warning("Invalid VAT format: %s", person_data['vat'])
                 # Remove invalid VAT instead of failing
                 del person_data['vat']
         
-        _logger.info(f"Final person data prepared: {person_data}")
+        _logger.debug("Final person data prepared: %s", person_data)
         return person_data
 
-    def _create_or_update_person(self, person_data):
+    def _queue_person(self, person_data, row_num, person_index, pending_creates, pending_updates):
         """
-        Create or update person record as child of company
-        Returns dict with action info: {'action': 'created'|'updated', 'person': person_record}
+        Queue prepared person data for the bulk create/write done after the CSV pass.
+        Existing persons are matched by name and parent company through person_index,
+        rows matching the same person are merged, later rows win.
         """
-        # Extract VAT before creating person (same as contacts)
+        # VAT is written with SQL after the records exist (same as contacts)
         vat_value = person_data.pop('vat', None)
+        company_name = person_data.pop('parent_company_name', None)
         
-        try:
-            _logger.info(f"Attempting to create/update person with data: {person_data}")
-            
-            # Check if person already exists by name and parent company
-            if person_data.get('parent_id', False):
-                domain = [
-                    ('name', '=', person_data['name']),
-                    ('parent_id', '=', person_data['parent_id']),
-                    ('is_company', '=', False)
-                ]
-            else:
-                domain = [
-                    ('name', '=', person_data['name']),
-                    ('is_company', '=', False)
-                ]
-            
-            existing_person = self.env['res.partner'].search(domain, limit=1)
-            _logger.info(f"Found existing person: {existing_person}")
-            
-            if existing_person:
-                # Update existing person without VAT
-                _logger.info(f"Updating existing person ID: {existing_person.id}")
-                
-                # Prepare update data (exclude fields that shouldn't be updated)
-                update_data = person_data.copy()
-                update_data.pop('parent_company_name', None)  # Remove helper field
-                
+        existing_person_id = person_index.get((person_data['name'], person_data.get('parent_id') or None))
+        if existing_person_id:
+            queue, key = pending_updates, existing_person_id
+        else:
+            queue, key = pending_creates, (person_data['name'], person_data.get('parent_id'))
+        
+        entry = queue.setdefault(key, {'vals': {}, 'vat': None})
+        entry['vals'].update(person_data)
+        entry['vat'] = vat_value or entry['vat']
+        entry['row'] = row_num
+        entry['company'] = company_name
+
+    def _apply_person_batch(self, pending_creates, pending_updates):
+        """
+        Write the queued persons in batches, then their VAT with a single SQL update
+        Returns (created, updated, errors), errors being (entry, exception) tuples.
+        """
+        created, updated, errors = self._write_import_batches('res.partner', pending_updates, list(pending_creates.values()))
+        
+        _logger.info("Persons batch applied: %s created, %s updated, %s errors", len(created), len(updated), len(errors))
+        
+        self._bulk_update_partner_vat_sql([(person_id, entry['vat'], None) for person_id, entry in created + updated])
+        
+        return [entry for person_id, entry in created], [entry for person_id, entry in updated], errors
+
+    def _write_import_batches(self, model_name, pending_updates, create_entries):
+        """
+        Write queued import entries ({'vals': ..., 'row': ...} dicts) with one write per
+        distinct set of values over the existing records (pending_updates maps record ids
+        to entries) and multi-record creates of _IMPORT_BATCH_SIZE records, committing
+        between batches. A failing batch is replayed row by row so that errors are still
+        reported against their CSV row.
+        Returns (created, updated, errors): (record id, entry) and (entry, exception) tuples.
+        """
+        Model = self.env[model_name]
+        created = []
+        updated = []
+        errors = []
+        
+        update_groups = defaultdict(list)
+        for record_id, entry in pending_updates.items():
+            update_groups[tuple(sorted(entry['vals'].items()))].append((record_id, entry))
+        
+        uncommitted = 0
+        for vals_key, group in update_groups.items():
+            for chunk in self._split_batches(group):
                 try:
-                    existing_person.write(update_data)
+                    with self.env.cr.savepoint():
+                        Model.browse([record_id for record_id, entry in chunk]).write(dict(vals_key))
+                    done = chunk
                 except Exception as e:
-                    _logger.error(f"Error updating person: {str(e)}")
-                    self.env.cr.rollback()
-
-                _logger.info(f"Updated person: {person_data.get('name')} (ID: {existing_person.id})")
-                result = {'action': 'updated', 'person': existing_person, 'vat': vat_value}
+                    _logger.warning("Bulk update of %s %s records failed, retrying row by row: %s", len(chunk), model_name, e)
+                    done = []
+                    for record_id, entry in chunk:
+                        try:
+                            with self.env.cr.savepoint():
+                                Model.browse(record_id).write(entry['vals'])
+                            done.append((record_id, entry))
+                        except Exception as e:
+                            errors.append((entry, e))
+                updated += done
+                uncommitted += len(chunk)
+                if uncommitted >= _IMPORT_BATCH_SIZE:
+                    self._commit_import_batch()
+                    uncommitted = 0
+        if uncommitted:
+            self._commit_import_batch()
+        
+        for chunk in self._split_batches(create_entries):
+            try:
+                with self.env.cr.savepoint():
+                    new_records = Model.create([entry['vals'] for entry in chunk])
+                done = list(zip(new_records.ids, chunk))
+            except Exception as e:
+                _logger.warning("Bulk create of %s %s records failed, retrying row by row: %s", len(chunk), model_name, e)
+                done = []
+                for entry in chunk:
+                    try:
+                        with self.env.cr.savepoint():
+                            new_record = Model.create(entry['vals'])
+                        done.append((new_record.id, entry))
+                    except Exception as e:
+                        errors.append((entry, e))
+            created += done
+            self._commit_import_batch()
+        
+        return created, updated, errors
 
-                self._update_partner_vat_cf_sql(result['person'].id, vat_value, None)
-            else:
-                # Create new person without VAT (same as contacts)
-                # Remove helper field before creating
-                create_data = person_data.copy()
-                create_data.pop('parent_company_name', None)
-                
-                new_person = self.env['res.partner'].create(create_data)
-                _logger.info(f"Created new person: {person_data.get('name')} (ID: {new_person.id})")
-                result = {'action': 'created', 'person': new_person, 'vat': vat_value}
+    def _split_batches(self, items):
+        """
+        Split a list in consecutive slices of at most _IMPORT_BATCH_SIZE items
+        """
+        return [items[i:i + _IMPORT_BATCH_SIZE] for i in range(0, len(items), _IMPORT_BATCH_SIZE)]
 
-                self._update_partner_vat_cf_sql(result['person'].id, vat_value, None)
-            
-            return result
-                
-        except Exception as e:
-            error_msg = f"Error creating/updating person {person_data.get('name', 'N/A')}: {str(e)}"
-            
-            # Log error to ir.logging
-            self._log_import_error(
-                error_type="Person Create/Update Error",
-                message=error_msg,
-                details=f"Person data: {person_data}",
-                import_type="persons"
-            )
-            
-            _logger.error(error_msg)
-            raise ValidationError(f"Error creating/updating person: {str(e)}")
+    def _commit_import_batch(self):
+        """
+        Commit the records and the import errors queued so far and drop the ORM cache,
+        so that long imports keep transactions short and memory bounded
+        """
+        self._flush_import_errors()
+        self.env.cr.commit()
+        self.env.invalidate_all()
 
     def _import_projects(self, file_data):
         """
@@ -674,60 +994,23 @@ class DbmImportWizard(models.TransientModel):
         # Start a new transaction for this import
         
         # Check if project module is installed
-        project_module = self.env['ir.module.module'].search([('name', '=', 'project'), ('state', '=', 'installed')])
-        if not project_module:
+        if not self._is_module_installed('project'):
             raise UserError("The 'project' module is not installed. Please install it first to import projects.")
         
         _logger.info("Project module is installed, proceeding with import")
         
-        # Check existing projects count
-        existing_projects_count = self.env['project.project'].search_count([])
-        _logger.info(f"Current projects count in database: {existing_projects_count}")
-        
-        # Test project creation before starting import
-        if not self._test_project_creation():
-            raise UserError("Project creation test failed. Please check the logs for more details.")
-        
         try:
             # Decode the file
             file_content = base64.b64decode(file_data)
             
             # Get delimiter
-            delimiter_map = {
-                'comma': ',',
-                'semicolon': ';',
-                'tab': '\t'
-            }
-            delimiter = delimiter_map.get(self.delimiter, ',')
+            delimiter = _DELIMITER_MAP.get(self.delimiter, ',')
             
-            # Handle file encoding
-            if self.file_encoding == 'auto':
-                # Try different encodings to handle various file formats
-                encodings_to_try = ['utf-8', 'utf-8-sig', 'cp1252', 'iso-8859-1', 'latin1']
-                csv_content = None
-                
-                for encoding in encodings_to_try:
-                    try:
-                        csv_content = file_content.decode(encoding)
-                        _logger.info(f"Successfully decoded file using encoding: {encoding}")
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if csv_content is None:
-                    raise UserError("Unable to decode the file. Please try selecting a specific encoding or save the file with UTF-8 encoding.")
-            else:
-                # Use user-selected encoding
-                try:
-                    csv_content = file_content.decode(self.file_encoding)
-                    _logger.info(f"Successfully decoded file using user-selected encoding: {self.file_encoding}")
-                except UnicodeDecodeError as e:
-                    
-                    raise UserError(f"Unable to decode the file using {self.file_encoding} encoding. Error: {str(e)}")
-            
-            # Parse CSV
-            csv_file = io.StringIO(csv_content)
-            reader = csv.DictReader(csv_file, delimiter=delimiter)
+            # Parse CSV, decoding lines lazily while reading
+            csv_file = self._open_csv_text(file_content)
+            delimiter = self._csv_delimiter(csv_file, delimiter)
+            reader = csv.reader(csv_file, delimiter=delimiter)
+            header = next(reader, [])
             
             # Field mapping for CSV columns to Odoo fields
             field_mapping = {
@@ -743,34 +1026,56 @@ class DbmImportWizard(models.TransientModel):
                 'Data fine effettiva': 'date',
                 'Data inizio pianificata': 'date_start',
             }
+            idx_map = self._csv_index_map(header, field_mapping)
             
-            created_count = 0
-            updated_count = 0
             error_count = 0
             errors = []
-            created_projects = []
-            updated_projects = []
             
-            for row_num, row in enumerate(reader, start=2):  # Start from 2 if header exists
+            partner_by_name = self._partner_name_index()
+            project_name_cell = self._csv_cell_getter(header, 'Commessa')
+            project_code_cell = self._csv_cell_getter(header, 'Codice')
+            # The stages used by the file are found or created once, before the rows
+            rows = list(enumerate(reader, start=2))  # Start from 2 if header exists
+            stage_cell = self._csv_column_getter(header, 'Stato')
+            stage_names = self._get_or_create_by_name('project.project.stage', {
+                _PROJECT_STAGE_MAP.get(stage.upper(), stage) for stage in (stage_cell(row) for row_num, row in rows) if stage
+            })
+            
+            # Existing projects are matched by code, or by name for rows without a code.
+            # Only the codes and names used by the file are read.
+            code_cell = self._csv_column_getter(header, 'Codice')
+            name_cell = self._csv_column_getter(header, 'Commessa')
+            codes = {code_cell(row) for row_num, row in rows} - {''}
+            names = {name_cell(row) for row_num, row in rows if not code_cell(row)} - {''}
+            project_index = {}
+            Project = self.env['project.project']
+            for project in Project.search_read([('code', 'in', list(codes))], ['code']) if codes else []:
+                project_index.setdefault(('code', project['code']), project['id'])
+            for project in Project.search_read([('name', 'in', list(names))], ['name']) if names else []:
+                project_index.setdefault(('name', project['name']), project['id'])
+            
+            # Rows are only prepared and queued here, projects are written in bulk after
+            # the CSV pass. Rows for the same project are merged, the last one winning.
+            pending_creates = {}
+            pending_updates = {}
+            for row_num, row in rows:
                 try:
-                    
-                    project_data = self._prepare_project_data(row, field_mapping)
+                    project_data = self._prepare_project_data(row, idx_map, partner_by_name, stage_names)
                     if project_data:
                         project_data['allow_billable'] = True
-                        result = self._create_or_update_project(project_data)
-                        if result['action'] == 'created':
-                            created_count += 1
-                            created_projects.append(f"{project_data.get('name', 'N/A')} (Codice: {project_data.get('code', 'N/A')})")
-                        elif result['action'] == 'updated':
-                            updated_count += 1
-                            updated_projects.append(f"{project_data.get('name', 'N/A')} (Codice: {project_data.get('code', 'N/A')})")
-                    
+                        # Project manager selected in the wizard, written along with the other values
+                        project_data.setdefault('user_id', self.user_id.id)
+                        key = ('code', project_data['code']) if project_data.get('code') else ('name', project_data.get('name'))
+                        project_id = project_index.get(key)
+                        pending = pending_updates if project_id else pending_creates
+                        entry = pending.setdefault(project_id or key, {'vals': {}, 'row': row_num})
+                        entry['vals'].update(project_data)
+                        entry['row'] = row_num
                     
                 except Exception as e:
-                    
                     error_count += 1
-                    project_name = row.get('Commessa', 'N/A')
-                    project_code = row.get('Codice', 'N/A')
+                    project_name = project_name_cell(row)
+                    project_code = project_code_cell(row)
                     error_msg = f"Row {row_num} - {project_name} (Codice: {project_code}): {str(e)}"
                     errors.append(error_msg)
                     
@@ -783,39 +1088,37 @@ class DbmImportWizard(models.TransientModel):
                         import_type="projects"
                     )
                     
-                    _logger.error(f"Error importing project at row {row_num}: {str(e)}")
+                    _logger.error("Error importing project at row %s: %s", row_num, e)
+            
+            created, updated, batch_errors = self._write_import_batches('project.project', pending_updates, list(pending_creates.values()))
+            created_count = len(created)
+            updated_count = len(updated)
+            created_projects = [f"{entry['vals'].get('name', 'N/A')} (Codice: {entry['vals'].get('code', 'N/A')})" for project_id, entry in created]
+            updated_projects = [f"{entry['vals'].get('name', 'N/A')} (Codice: {entry['vals'].get('code', 'N/A')})" for project_id, entry in updated]
+            for entry, e in batch_errors:
+                error_count += 1
+                error_msg = f"Row {entry['row']} - {entry['vals'].get('name', 'N/A')} (Codice: {entry['vals'].get('code', 'N/A')}): {str(e)}"
+                errors.append(error_msg)
+                self._log_import_error(
+                    error_type="Project Create/Update Error",
+                    message=error_msg,
+                    details=f"Project data: {entry['vals']}",
+                    row_number=entry['row'],
+                    import_type="projects"
+                )
+                _logger.error("Error writing project at row %s: %s", entry['row'], e)
             
             # Update note with detailed results
-            result_message = f"Import progetti completato:\n"
-            result_message += f"- Progetti creati: {created_count}\n"
-            result_message += f"- Progetti aggiornati: {updated_count}\n"
-            result_message += f"- Errori: {error_count}\n"
-            
-            # Show created projects
-            if created_projects:
-                result_message += f"\nProgetti creati:\n"
-                for project in created_projects[:10]:  # Show first 10
-                    result_message += f"- {project}\n"
-                if len(created_projects) > 10:
-                    result_message += f"... e altri {len(created_projects) - 10} progetti creati\n"
-            
-            # Show updated projects
-            if updated_projects:
-                result_message += f"\nProgetti aggiornati:\n"
-                for project in updated_projects[:10]:  # Show first 10
-                    result_message += f"- {project}\n"
-                if len(updated_projects) > 10:
-                    result_message += f"... e altri {len(updated_projects) - 10} progetti aggiornati\n"
-            
-            # Show errors
-            if errors:
-                result_message += f"\nErrori riscontrati:\n"
-                for error in errors[:10]:  # Show first 10 errors
-                    result_message += f"- {error}\n"
-                if len(errors) > 10:
-                    result_message += f"... e altri {len(errors) - 10} errori\n"
-            
-            self.note = result_message
+            result_lines = [
+                "Import progetti completato:",
+                f"- Progetti creati: {created_count}",
+                f"- Progetti aggiornati: {updated_count}",
+                f"- Errori: {error_count}",
+            ]
+            result_lines += self._result_section("Progetti creati", created_projects, created_count, "e altri {} progetti creati")
+            result_lines += self._result_section("Progetti aggiornati", updated_projects, updated_count, "e altri {} progetti aggiornati")
+            result_lines += self._result_section("Errori riscontrati", errors, len(errors), "e altri {} errori")
+            self.note = "\n".join(result_lines) + "\n"
             
             # Prepare notification message
             notification_msg = f"Creati: {created_count}, Aggiornati: {updated_count}"
@@ -823,6 +1126,7 @@ class DbmImportWizard(models.TransientModel):
                 notification_msg += f", Errori: {error_count}"
             
 
+            self._flush_import_errors()
             self.env.cr.commit()
 
             
@@ -859,8 +1163,7 @@ class DbmImportWizard(models.TransientModel):
         self.env.cr.commit()
         
         # Check if stock module is installed
-        stock_module = self.env['ir.module.module'].search([('name', '=', 'stock'), ('state', '=', 'installed')])
-        if not stock_module:
+        if not self._is_module_installed('stock'):
             raise UserError("The 'stock' module is not installed. Please install it first to import stock lots.")
         
         _logger.info("Stock module is installed, proceeding with import")
@@ -870,40 +1173,13 @@ class DbmImportWizard(models.TransientModel):
             file_content = base64.b64decode(file_data)
             
             # Get delimiter
-            delimiter_map = {
-                'comma': ',',
-                'semicolon': ';',
-                'tab': '\t'
-            }
-            delimiter = delimiter_map.get(self.delimiter, ',')
-            
-            # Handle file encoding
-            if self.file_encoding == 'auto':
-                # Try different encodings to handle various file formats
-                encodings_to_try = ['utf-8', 'utf-8-sig', 'cp1252', 'iso-8859-1', 'latin1']
-                csv_content = None
-                
-                for encoding in encodings_to_try:
-                    try:
-                        csv_content = file_content.decode(encoding)
-                        _logger.info(f"Successfully decoded file using encoding: {encoding}")
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if csv_content is None:
-                    raise UserError("Unable to decode the file. Please try selecting a specific encoding or save the file with UTF-8 encoding.")
-            else:
-                # Use user-selected encoding
-                try:
-                    csv_content = file_content.decode(self.file_encoding)
-                    _logger.info(f"Successfully decoded file using user-selected encoding: {self.file_encoding}")
-                except UnicodeDecodeError as e:
-                    raise UserError(f"Unable to decode the file using {self.file_encoding} encoding. Error: {str(e)}")
+            delimiter = _DELIMITER_MAP.get(self.delimiter, ',')
             
-            # Parse CSV
-            csv_file = io.StringIO(csv_content)
-            reader = csv.DictReader(csv_file, delimiter=delimiter)
+            # Parse CSV, decoding lines lazily while reading
+            csv_file = self._open_csv_text(file_content)
+            delimiter = self._csv_delimiter(csv_file, delimiter)
+            reader = csv.reader(csv_file, delimiter=delimiter)
+            header = next(reader, [])
             
             # Field mapping for CSV columns to Odoo fields
             field_mapping = {
@@ -920,30 +1196,43 @@ class DbmImportWizard(models.TransientModel):
                 'Garanzia ricambi': 'parts_warranty',
                 'Garanzia on site': 'onsite_warranty',
             }
+            idx_map = self._csv_index_map(header, field_mapping)
             
-            created_count = 0
-            updated_count = 0
             error_count = 0
             errors = []
-            created_lots = []
-            updated_lots = []
             
-            for row_num, row in enumerate(reader, start=2):  # Start from 2 if header exists
+            # Rows are only prepared and queued here, lots are written in bulk after the CSV pass.
+            # Rows for the same lot and product are merged, later rows win.
+            rows = list(enumerate(reader, start=2))  # Start from 2 if header exists
+            # Rows without lot name are rejected, don't resolve (and create) their products
+            lot_name = self._csv_column_getter(header, 'Matricola Interna')
+            rows_with_name = [row for row_num, row in rows if lot_name(row)]
+            product_code = self._csv_column_getter(header, 'Codice prodotto')
+            product_name = self._csv_column_getter(header, 'Nome prodotto')
+            product_index = self._resolve_stock_lot_products({(product_code(row), product_name(row)) for row in rows_with_name})
+            rental_company = self._csv_column_getter(header, 'Azienda Locazione Macchina')
+            rental_company_index = self._resolve_partner_names(rental_company(row) for row in rows_with_name)
+            pending_lots = {}
+            duplicates_in_file = 0
+            lot_name_cell = self._csv_cell_getter(header, 'Matricola Interna')
+            product_code_cell = self._csv_cell_getter(header, 'Codice prodotto')
+            for row_num, row in rows:
                 try:
-                    lot_data = self._prepare_stock_lot_data(row, field_mapping)
+                    lot_data = self._prepare_stock_lot_data(row, idx_map, product_index, rental_company_index)
                     if lot_data:
-                        result = self._create_or_update_stock_lot(lot_data)
-                        if result['action'] == 'created':
-                            created_count += 1
-                            created_lots.append(f"{lot_data.get('name', 'N/A')} (Prodotto: {lot_data.get('product_name', 'N/A')})")
-                        elif result['action'] == 'updated':
-                            updated_count += 1
-                            updated_lots.append(f"{lot_data.get('name', 'N/A')} (Prodotto: {lot_data.get('product_name', 'N/A')})")
+                        product_name = lot_data.pop('product_name', None)  # Remove helper field
+                        key = (lot_data['name'], lot_data['product_id'])
+                        if key in pending_lots:
+                            duplicates_in_file += 1
+                        entry = pending_lots.setdefault(key, {'vals': {}})
+                        entry['vals'].update(lot_data)
+                        entry['row'] = row_num
+                        entry['product_name'] = product_name
                     
                 except Exception as e:
                     error_count += 1
-                    lot_name = row.get('Matricola Interna', 'N/A')
-                    product_code = row.get('Codice prodotto', 'N/A')
+                    lot_name = lot_name_cell(row)
+                    product_code = product_code_cell(row)
                     error_msg = f"Row {row_num} - {lot_name} (Prodotto: {product_code}): {str(e)}"
                     errors.append(error_msg)
                     
@@ -956,45 +1245,47 @@ class DbmImportWizard(models.TransientModel):
                         import_type="stock_lots"
                     )
                     
-                    _logger.error(f"Error importing stock lot at row {row_num}: {str(e)}")
+                    _logger.error("Error importing stock lot at row %s: %s", row_num, e)
+            
+            if duplicates_in_file:
+                _logger.info("Merged %s duplicate stock lot rows (same lot and product) in file", duplicates_in_file)
+            created, updated, batch_errors = self._apply_stock_lot_batch(pending_lots)
+            created_count = len(created)
+            updated_count = len(updated)
+            created_lots = [f"{entry['vals'].get('name', 'N/A')} (Prodotto: {entry['product_name'] or 'N/A'})" for entry in created[:10]]
+            updated_lots = [f"{entry['vals'].get('name', 'N/A')} (Prodotto: {entry['product_name'] or 'N/A'})" for entry in updated[:10]]
+            for entry, e in batch_errors:
+                error_count += 1
+                error_msg = f"Row {entry['row']} - {entry['vals'].get('name', 'N/A')} (Prodotto: {entry['product_name'] or 'N/A'}): {str(e)}"
+                errors.append(error_msg)
+                self._log_import_error(
+                    error_type="Stock Lot Create/Update Error",
+                    message=error_msg,
+                    details=f"Lot data: {entry['vals']}",
+                    row_number=entry['row'],
+                    import_type="stock_lots"
+                )
+                _logger.error("Error importing stock lot at row %s: %s", entry['row'], e)
             
             # Update note with detailed results
-            result_message = f"Import lotti completato:\n"
-            result_message += f"- Lotti creati: {created_count}\n"
-            result_message += f"- Lotti aggiornati: {updated_count}\n"
-            result_message += f"- Errori: {error_count}\n"
-            
-            # Show created lots
-            if created_lots:
-                result_message += f"\nLotti creati:\n"
-                for lot in created_lots[:10]:  # Show first 10
-                    result_message += f"- {lot}\n"
-                if len(created_lots) > 10:
-                    result_message += f"... e altri {len(created_lots) - 10} lotti creati\n"
-            
-            # Show updated lots
-            if updated_lots:
-                result_message += f"\nLotti aggiornati:\n"
-                for lot in updated_lots[:10]:  # Show first 10
-                    result_message += f"- {lot}\n"
-                if len(updated_lots) > 10:
-                    result_message += f"... e altri {len(updated_lots) - 10} lotti aggiornati\n"
-            
-            # Show errors
-            if errors:
-                result_message += f"\nErrori riscontrati:\n"
-                for error in errors[:10]:  # Show first 10 errors
-                    result_message += f"- {error}\n"
-                if len(errors) > 10:
-                    result_message += f"... e altri {len(errors) - 10} errori\n"
-            
-            self.note = result_message
+            result_lines = [
+                "Import lotti completato:",
+                f"- Lotti creati: {created_count}",
+                f"- Lotti aggiornati: {updated_count}",
+                f"- Righe duplicate nel file (stessa Matricola e prodotto): {duplicates_in_file}",
+                f"- Errori: {error_count}",
+            ]
+            result_lines += self._result_section("Lotti creati", created_lots, created_count, "e altri {} lotti creati")
+            result_lines += self._result_section("Lotti aggiornati", updated_lots, updated_count, "e altri {} lotti aggiornati")
+            result_lines += self._result_section("Errori riscontrati", errors, len(errors), "e altri {} errori")
+            self.note = "\n".join(result_lines) + "\n"
             
             # Prepare notification message
             notification_msg = f"Creati: {created_count}, Aggiornati: {updated_count}"
             if error_count > 0:
                 notification_msg += f", Errori: {error_count}"
             
+            self._flush_import_errors()
             self.env.cr.commit()
             
             return {
@@ -1022,130 +1313,182 @@ class DbmImportWizard(models.TransientModel):
             _logger.error(error_msg)
             raise UserError(error_msg)
 
-    def _prepare_stock_lot_data(self, row, field_mapping):
+    def _resolve_partner_names(self, names):
         """
-        Prepare stock lot data from CSV row
+        Resolve partner names the way a per-name ('name', 'ilike', name) search would,
+        see _resolve_names_ilike
+        Returns a dict mapping each found name to the id of the matching partner
         """
-        lot_data = {}
-        _logger.info(f"Preparing stock lot data from row: {row}")
+        return {name: record['id'] for name, record in self._resolve_names_ilike('res.partner', names).items()}
+
+    def _resolve_names_ilike(self, model_name, names):
+        """
+        Resolve names of model_name records the way per-name ('name', 'ilike', name)
+        searches would. Names equal (case-insensitive) to a record name are matched
+        from an index loaded with one query per _IMPORT_BATCH_SIZE names, only the
+        other ones fall back to a ('name', 'ilike', name) search with limit=1.
+        Returns a dict mapping each found name to the matching {'id', 'name'} record
+        """
+        names = sorted({name for name in names if name})
+        if not names:
+            return {}
+        Model = self.env[model_name]
+        by_lower_name = {}
+        for chunk in self._split_batches(names):
+            domain = expression.OR([[('name', '=ilike', _like_escape(name))] for name in chunk])
+            for record in Model.search_read(domain, ['name']):
+                by_lower_name.setdefault((record['name'] or '').lower(), record)
         
-        for csv_field, odoo_field in field_mapping.items():
-            if csv_field in row and row[csv_field].strip():
-                value = row[csv_field].strip()
-                
-                # Special handling for specific fields
-                if odoo_field in ['product_code', 'product_name']:
-                    # Store product code and name for later processing
-                    lot_data[odoo_field] = value
-                    
-                elif odoo_field in ['rental_company_id']:
-                    # Find partner by name
-                    partner = self.env['res.partner'].search([
-                        ('name', 'ilike', value)
-                    ], limit=1)
-                    if partner:
-                        lot_data[odoo_field] = partner.id
-                    else:
-                        _logger.warning(f"Partner '{value}' not found for field {odoo_field}")
-                        
-                elif odoo_field == 'testing_status':
-                    # Map testing status
-                    status_mapping = {
-                        'collaudato': 'tested',
-                        'tested': 'tested',
-                        'in attesa': 'pending',
-                        'pending': 'pending',
-                        'non collaudato': 'not_tested',
-                        'not tested': 'not_tested',
-                    }
-                    status_key = value.strip().lower()
-                    lot_data[odoo_field] = status_mapping.get(status_key, 'not_tested')
-                        
-                elif odoo_field in ['labor_warranty', 'parts_warranty', 'onsite_warranty']:
-                    # Parse warranty dates
-                    try:
-                        date_formats = [
-                            '%d/%m/%Y %H:%M',      # 05/11/2030 1:00
-                            '%d/%m/%Y %H:%M:%S',   # 05/11/2030 1:00:00
-                            '%d/%m/%Y',            # 05/11/2030
-                            '%Y-%m-%d %H:%M:%S',   # 2030-11-05 01:00:00
-                            '%Y-%m-%d %H:%M',      # 2030-11-05 01:00
-                            '%Y-%m-%d',            # 2030-11-05
-                        ]
-                        parsed_date = None
-                        
-                        for date_format in date_formats:
-                            try:
-                                parsed_date = datetime.strptime(value, date_format)
-                                break
-                            except ValueError:
-                                continue
-                        
-                        if parsed_date:
-                            lot_data[odoo_field] = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
-                            _logger.info(f"Successfully parsed warranty date '{value}' as '{lot_data[odoo_field]}' for field {odoo_field}")
-                        else:
-                            _logger.warning(f"Unable to parse warranty date '{value}' for field {odoo_field}")
-                    except Exception as e:
-                        _logger.warning(f"Error parsing warranty date '{value}': {str(e)}")
-                        
-                elif odoo_field == 'note':
-                    # Combine product name and notes
-                    if 'note' in lot_data and lot_data['note']:
-                        lot_data[odoo_field] += f" | {value}"
-                    else:
-                        lot_data[odoo_field] = value
-                        
-                elif odoo_field in ['manufacturer_lot', 'customer_lot']:
-                    # Store in dedicated fields
-                    lot_data[odoo_field] = value
-                        
-                else:
-                    lot_data[odoo_field] = value
+        name_index = {}
+        for name in names:
+            record = by_lower_name.get(name.lower())
+            if record is None:
+                records = Model.search_read([('name', 'ilike', name)], ['name'], limit=1)
+                record = records[0] if records else None
+            if record:
+                name_index[name] = record
+        return name_index
+
+    def _csv_mapped_values(self, rows, idx_map, odoo_field):
+        """
+        Return the distinct non-empty stripped values of the columns mapped to odoo_field in (row number, positional row) pairs
+        """
+        columns = [i for i, csv_field, mapped_field in idx_map if mapped_field == odoo_field]
+        return {
+            value
+            for row_num, row in rows for i in columns if i < len(row)
+            for value in [row[i].strip()] if value
+        }
+
+    def _get_or_create_by_name(self, model_name, names):
+        """
+        Map each name to the id of the model_name record with that name, reading the
+        existing records with one query and creating the missing ones in one batch
+        """
+        names = {name for name in names if name}
+        if not names:
+            return {}
+        Model = self.env[model_name]
+        name_index = {}
+        for record in Model.search_fetch([('name', 'in', list(names))], ['name']):
+            name_index.setdefault(record.name, record.id)
+        missing = sorted(names - set(name_index))
+        if missing:
+            for name, record in zip(missing, Model.create([{'name': name} for name in missing])):
+                name_index[name] = record.id
+            _logger.info("Created %s %s records: %s", len(missing), model_name, ", ".join(missing))
+        return name_index
+
+    def _partner_name_index(self):
+        """
+        Map the lowercased names of the active partners to their ids with a single query.
+        For duplicate names the partner kept is the first of the res.partner order.
+        """
+        self.env['res.partner'].flush_model(['name', 'complete_name', 'active'])
+        self.env.cr.execute("""
+            SELECT lower(name), id FROM res_partner
+            WHERE active AND name IS NOT NULL
+            ORDER BY complete_name DESC, id
+        """)
+        return dict(self.env.cr.fetchall())
+
+    def _match_partner_name(self, name, partner_by_name):
+        """
+        Return the id of the partner with this name (case-insensitive) from partner_by_name,
+        see _partner_name_index, or False. Names without exact match fall back to a
+        ('name', 'ilike', name) search, whose result is remembered in partner_by_name.
+        """
+        key = name.lower()
+        if key not in partner_by_name:
+            partner_by_name[key] = self.env['res.partner'].search([('name', 'ilike', name)], limit=1).id
+        return partner_by_name[key]
+
+    def _resolve_stock_lot_products(self, pairs):
+        """
+        Resolve the (product code, product name) pairs of all stock lot rows at once: by
+        default code with a single query, then by name, creating the missing products in one batch
+        Returns a dict mapping (product code, product name) to (product id, product name)
+        """
+        Product = self.env['product.product']
+        pairs = set(pairs)
+        pairs.discard(('', ''))
         
-        # Process product identification after collecting all fields
-        if 'product_code' in lot_data or 'product_name' in lot_data:
-            product_code = lot_data.get('product_code', '')
-            product_name = lot_data.get('product_name', '')
-            
-            # Find product by code first, then by name
-            product = None
-            if product_code:
-                product = self.env['product.product'].search([
-                    ('default_code', '=', product_code)
-                ], limit=1)
-            
-            if not product and product_name:
-                product = self.env['product.product'].search([
-                    ('name', 'ilike', product_name)
-                ], limit=1)
-            
+        by_code = {}
+        codes = [code for code, name in pairs if code]
+        if codes:
+            for product in Product.search_read([('default_code', 'in', codes)], ['default_code', 'name']):
+                by_code.setdefault(product['default_code'], (product['id'], product['name']))
+        
+        # Names of the pairs not matched by code are looked up exactly first, see _resolve_names_ilike
+        by_name = {
+            name: (product['id'], product['name'])
+            for name, product in self._resolve_names_ilike(
+                'product.product', (name for code, name in pairs if code not in by_code)
+            ).items()
+        }
+        
+        product_index = {}
+        missing = {}
+        for code, name in pairs:
+            product = by_code.get(code) or by_name.get(name)
             if product:
-                lot_data['product_id'] = product.id
-                lot_data['product_name'] = product.name
-                _logger.info(f"Found product: {product.name} (Code: {product.default_code})")
+                product_index[(code, name)] = product
             else:
-                # Create a new product if not found
-                new_product_name = product_name or product_code or 'Prodotto Importato'
-                new_product_code = product_code or f"IMP-{int(datetime.now().timestamp())}"
-                
-                product = self.env['product.product'].create({
-                    'name': new_product_name,
-                    'default_code': new_product_code,
+                # Rows sharing a code (or, without code, a name) get the same new product
+                missing.setdefault(code or ('', name), []).append((code, name))
+        
+        if missing:
+            # Create a new product if not found
+            timestamp = int(datetime.now().timestamp())
+            vals_list = []
+            for i, group in enumerate(missing.values()):
+                code, name = group[0]
+                vals_list.append({
+                    'name': name or code or 'Prodotto Importato',
+                    # Products without a code get one unique within the batch
+                    'default_code': code or f"IMP-{timestamp}-{i}",
                     'type': 'consu',
                     'is_storable': True,
                     'sale_ok': True,
                     'purchase_ok': True,  # Enable lot tracking
                 })
-                lot_data['product_id'] = product.id
-                lot_data['product_name'] = product.name
-                _logger.info(f"Created new product: {product.name} (Code: {product.default_code})")
-            
-            # Remove temporary fields
-            lot_data.pop('product_code', None)
+            try:
+                with self.env.cr.savepoint():
+                    products = list(Product.create(vals_list))
+            except Exception as e:
+                _logger.warning("Bulk creation of %s products failed, retrying one by one: %s", len(vals_list), e)
+                products = []
+                for vals in vals_list:
+                    try:
+                        with self.env.cr.savepoint():
+                            products.append(Product.create(vals))
+                    except Exception as e:
+                        # Rows of this product are rejected as missing a product
+                        _logger.warning("Unable to create product %s: %s", vals['name'], e)
+                        products.append(None)
+            for product, group in zip(products, missing.values()):
+                if not product:
+                    continue
+                for pair in group:
+                    product_index[pair] = (product.id, product.name)
+                _logger.info("Created new product: %s (Code: %s)", product.name, product.default_code)
         
-        # Set default values and validate required fields
-        if 'name' not in lot_data or not lot_data['name'].strip():
+        return product_index
+
+    def _prepare_stock_lot_data(self, row, idx_map, product_index, rental_company_index):
+        """
+        Prepare stock lot data from CSV row
+        product_index maps (product code, product name) to (product id, product name),
+        see _resolve_stock_lot_products, rental_company_index maps partner names to ids,
+        see _resolve_partner_names
+        """
+        lot_data = {}
+        _logger.debug("Preparing stock lot data from row: %s", row)
+        row_values = self._csv_row_values(row, idx_map)
+        cells = {odoo_field: value for csv_field, odoo_field, value in row_values}
+        
+        # Reject rows without lot name or product before processing the other columns
+        if 'name' not in cells:
             error_msg = "Lot name (Matricola Interna) is required"
             self._log_import_error(
                 error_type="Stock Lot Validation Error",
@@ -1155,7 +1498,8 @@ class DbmImportWizard(models.TransientModel):
             )
             raise ValidationError(error_msg)
         
-        if 'product_id' not in lot_data:
+        product = product_index.get((cells.get('product_code', ''), cells.get('product_name', '')))
+        if not product:
             error_msg = "Product (Codice prodotto or Nome prodotto) is required"
             self._log_import_error(
                 error_type="Stock Lot Validation Error",
@@ -1165,141 +1509,154 @@ class DbmImportWizard(models.TransientModel):
             )
             raise ValidationError(error_msg)
         
+        for csv_field, odoo_field, value in row_values:
+            # Special handling for specific fields
+            if odoo_field in ['product_code', 'product_name']:
+                # Product already resolved above
+                continue
+                
+            elif odoo_field in ['rental_company_id']:
+                # Find partner by name
+                partner_id = rental_company_index.get(value)
+                if partner_id:
+                    lot_data[odoo_field] = partner_id
+                else:
+                    _logger.warning("Partner '%s' not found for field %s", value, odoo_field)
+                    
+            elif odoo_field == 'testing_status':
+                # Map testing status
+                status_key = value.lower()
+                lot_data[odoo_field] = _TESTING_STATUS_MAP.get(status_key, 'not_tested')
+                    
+            elif odoo_field in ['labor_warranty', 'parts_warranty', 'onsite_warranty']:
+                # Parse warranty dates
+                try:
+                    parsed_date = _parse_date(value)
+                    
+                    if parsed_date:
+                        lot_data[odoo_field] = parsed_date.strftime('%Y-%m-%d')
+                        _logger.debug("Successfully parsed warranty date '%s' as '%s' for field %s", value, lot_data[odoo_field], odoo_field)
+                    else:
+                        _logger.warning("Unable to parse warranty date '%s' for field %s", value, odoo_field)
+                except Exception as e:
+                    _logger.warning("Error parsing warranty date '%s': %s", value, e)
+                    
+            elif odoo_field == 'note':
+                # Combine product name and notes
+                if 'note' in lot_data and lot_data['note']:
+                    lot_data[odoo_field] += f" | {value}"
+                else:
+                    lot_data[odoo_field] = value
+                    
+            elif odoo_field in ['manufacturer_lot', 'customer_lot']:
+                # Store in dedicated fields
+                lot_data[odoo_field] = value
+                    
+            else:
+                lot_data[odoo_field] = value
+    
+        lot_data['product_id'], lot_data['product_name'] = product
+        _logger.debug("Found product: %s (Code: %s)", lot_data['product_name'], cells.get('product_code', ''))
+        
         # Set default note if not provided
         if 'note' not in lot_data:
             lot_data['note'] = ""
         
-        _logger.info(f"Final stock lot data prepared: {lot_data}")
+        _logger.debug("Final stock lot data prepared: %s", lot_data)
         return lot_data
 
-    def _create_or_update_stock_lot(self, lot_data):
+    def _apply_stock_lot_batch(self, pending_lots):
         """
-        Create or update stock lot record
-        Returns dict with action info: {'action': 'created'|'updated', 'lot': lot_record}
+        Write the queued stock lots: existing lots (same name and product) are found with
+        a single query, then updated and created in batches
+        Returns (created, updated, errors), errors being (entry, exception) tuples.
         """
-        try:
-            _logger.info(f"Attempting to create/update stock lot with data: {lot_data}")
-            
-            # Check if lot already exists by name and product_id
-            domain = [
-                ('name', '=', lot_data['name']),
-                ('product_id', '=', lot_data['product_id'])
-            ]
-            
-            existing_lot = self.env['stock.lot'].search(domain, limit=1)
-            _logger.info(f"Found existing lot: {existing_lot}")
-            
-            if existing_lot:
-                # Update existing lot
-                _logger.info(f"Updating existing lot ID: {existing_lot.id}")
-                
-                # Prepare update data (exclude fields that shouldn't be updated)
-                update_data = lot_data.copy()
-                update_data.pop('product_name', None)  # Remove helper field
-                
-                existing_lot.write(update_data)
-                _logger.info(f"Successfully updated lot: {lot_data.get('name')} (ID: {existing_lot.id})")
-                return {'action': 'updated', 'lot': existing_lot}
+        existing_lots = {}
+        if pending_lots:
+            lots = self.env['stock.lot'].search_read([
+                ('name', 'in', list({name for name, product_id in pending_lots})),
+                ('product_id', 'in', list({product_id for name, product_id in pending_lots})),
+            ], ['name', 'product_id'])
+            for lot in lots:
+                if lot['product_id']:
+                    existing_lots.setdefault((lot['name'], lot['product_id'][0]), lot['id'])
+        
+        pending_updates = {}
+        create_entries = []
+        for key, entry in pending_lots.items():
+            if key in existing_lots:
+                pending_updates[existing_lots[key]] = entry
             else:
-                # Create new lot
-                _logger.info(f"Creating new lot with data: {lot_data}")
-                
-                # Prepare create data (exclude fields that shouldn't be created)
-                create_data = lot_data.copy()
-                create_data.pop('product_name', None)  # Remove helper field
-                
-                new_lot = self.env['stock.lot'].create(create_data)
-                _logger.info(f"Successfully created new lot: {lot_data.get('name')} (ID: {new_lot.id})")
-                
-                # Verify the lot was actually created
-                if new_lot.exists():
-                    _logger.info(f"Lot creation verified - ID: {new_lot.id}, Name: {new_lot.name}")
-                else:
-                    _logger.error("Lot creation failed - record does not exist after creation")
-                    raise ValidationError("Lot creation failed - record does not exist after creation")
-                
-                return {'action': 'created', 'lot': new_lot}
-                
-        except Exception as e:
-            error_msg = f"Error creating/updating stock lot {lot_data.get('name', 'N/A')}: {str(e)}"
-            
-            # Log error to ir.logging
-            self._log_import_error(
-                error_type="Stock Lot Create/Update Error",
-                message=error_msg,
-                details=f"Lot data: {lot_data}",
-                import_type="stock_lots"
-            )
-            
-            _logger.error(error_msg)
-            raise ValidationError(f"Error creating/updating stock lot: {str(e)}")
+                create_entries.append(entry)
+        
+        created, updated, errors = self._write_import_batches('stock.lot', pending_updates, create_entries)
+        _logger.info("Stock lots batch applied: %s created, %s updated, %s errors", len(created), len(updated), len(errors))
+        return [entry for lot_id, entry in created], [entry for lot_id, entry in updated], errors
 
-    def _prepare_partner_data(self, row, field_mapping):
+    def _prepare_partner_data(self, row, idx_map, country_by_code, state_by_country):
         """
         Prepare partner data from CSV row
+        country_by_code maps country codes to ids, state_by_country maps a country id
+        (or False for any country) to a dict of state codes to ids
         """
         partner_data = {}
+        row_values = self._csv_row_values(row, idx_map)
+        
+        # Reject rows without Codice before processing the other columns
+        if not any(odoo_field == 'ref' for csv_field, odoo_field, value in row_values):
+            error_msg = "Codice is required"
+            self._log_import_error(
+                error_type="Partner Validation Error",
+                message=error_msg,
+                details=f"Row data: {row}",
+                import_type="partners"
+            )
+            raise ValidationError(error_msg)
         
         # First pass: process basic fields and country
-        for csv_field, odoo_field in field_mapping.items():
-            if csv_field in row and row[csv_field].strip():
-                value = row[csv_field].strip()
-                
-                # Process country first
-                if odoo_field == 'country_id':
-                    country = self.env['res.country'].search([('code', '=', value)], limit=1)
-                    if country:
-                        partner_data[odoo_field] = country.id
-                    else:
-                        _logger.warning(f"Country with code '{value}' not found")
-                # Process other basic fields
-                elif odoo_field not in ['state_id', 'vat', 'phone']:
-                    if odoo_field == 'zip':
-                        # Validate postal code format
-                        if value.isdigit() and len(value) == 5:
-                            partner_data[odoo_field] = value
-                        else:
-                            _logger.warning(f"Invalid postal code format: {value}")
-                    else:
+        for csv_field, odoo_field, value in row_values:
+            # Process country first
+            if odoo_field == 'country_id':
+                country_id = country_by_code.get(value.upper())
+                if country_id:
+                    partner_data[odoo_field] = country_id
+                else:
+                    _logger.warning("Country with code '%s' not found", value)
+            # Process other basic fields
+            elif odoo_field not in ['state_id', 'vat', 'phone']:
+                if odoo_field == 'zip':
+                    # Validate postal code format
+                    if _ZIP_RE.match(value):
                         partner_data[odoo_field] = value
+                    else:
+                        _logger.warning("Invalid postal code format: %s", value)
+                else:
+                    partner_data[odoo_field] = value
         
         # Second pass: process fields that depend on country (like state_id)
-        for csv_field, odoo_field in field_mapping.items():
-            if csv_field in row and row[csv_field].strip() and odoo_field == 'state_id':
-                value = row[csv_field].strip()
-                
+        for csv_field, odoo_field, value in row_values:
+            if odoo_field == 'state_id':
                 # Find state by code, considering the country
-                country_id = partner_data.get('country_id')
-                if country_id:
-                    state = self.env['res.country.state'].search([
-                        ('code', '=', value),
-                        ('country_id', '=', country_id)
-                    ], limit=1)
-                else:
-                    # If no country specified, try to find by code only
-                    state = self.env['res.country.state'].search([
-                        ('code', '=', value)
-                    ], limit=1)
+                # If no country specified, try to find by code only
+                country_id = partner_data.get('country_id', False)
+                state_id = state_by_country.get(country_id, {}).get(value)
                 
-                if state:
-                    partner_data[odoo_field] = state.id
+                if state_id:
+                    partner_data[odoo_field] = state_id
                 else:
                     country_name = "any country" if not country_id else f"country ID {country_id}"
-                    _logger.warning(f"State with code '{value}' not found in {country_name}")
+                    _logger.warning("State with code '%s' not found in %s", value, country_name)
         
         # Third pass: process duplicate fields (vat, phone)
-        for csv_field, odoo_field in field_mapping.items():
-            if csv_field in row and row[csv_field].strip():
-                value = row[csv_field].strip()
-                
-                if odoo_field == 'vat' and not partner_data.get('vat'):
-                    # Always add VAT, we'll handle validation during creation
-                    partner_data['vat'] = value
-                elif odoo_field == 'phone' and not partner_data.get('phone'):
-                    partner_data['phone'] = value
+        for csv_field, odoo_field, value in row_values:
+            if odoo_field == 'vat' and not partner_data.get('vat'):
+                # Always add VAT, we'll handle validation during creation
+                partner_data['vat'] = value
+            elif odoo_field == 'phone' and not partner_data.get('phone'):
+                partner_data['phone'] = value
         
         # Set default values and validate required fields
-        if 'name' not in partner_data or not partner_data['name'].strip():
+        if not partner_data.get('name'):
             partner_data['name'] = partner_data.get('ref', 'N/A')
             # error_msg = "Partner name is required"
             # self._log_import_error(
@@ -1309,30 +1666,19 @@ class DbmImportWizard(models.TransientModel):
             #     import_type="partners"
             # )
             # raise ValidationError(error_msg)
-        if 'ref' not in partner_data or not partner_data['ref'].strip():
-            error_msg = "Codice is required"
-            self._log_import_error(
-                error_type="Partner Validation Error",
-                message=error_msg,
-                details=f"Row data: {row}",
-                import_type="partners"
-            )
-            raise ValidationError(error_msg)
         
         # Validate email format if provided
         if 'email' in partner_data and partner_data['email']:
-            import re
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, partner_data['email']):
-                _logger.warning(f"Invalid email format: {partner_data['email']}")
+            if not _EMAIL_RE.match(partner_data['email']):
+                _logger.warning("Invalid email format: %s", partner_data['email'])
                 # Remove invalid email instead of failing
                 del partner_data['email']
         
         # Validate VAT format if provided
         if 'vat' in partner_data and partner_data['vat']:
-            vat = partner_data['vat'].replace(' ', '').replace('.', '').replace('-', '')
+            vat = partner_data['vat'].translate(_VAT_STRIP)
             if not vat.isalnum() or len(vat) < 8:
-                _logger.warning(f"Invalid VAT format: {partner_data['vat']}")
+                _logger.warning("Invalid VAT format: %s", partner_data['vat'])
                 # Remove invalid VAT instead of failing
                 del partner_data['vat']
         
@@ -1342,17 +1688,15 @@ class DbmImportWizard(models.TransientModel):
         partner_data['company_type'] = 'company'
         
         # Set country to Italy by default
-        italy = self.env['res.country'].search([('code', '=', 'IT')], limit=1)
-        if italy:
-            partner_data['country_id'] = italy.id
+        italy_id = country_by_code.get('IT')
+        if italy_id:
+            partner_data['country_id'] = italy_id
         
         # Process special fields for notes (Num.tel.2 and Fax)
-        notes_parts = []
-        if 'Num.tel.2' in row and row['Num.tel.2'].strip():
-            notes_parts.append(f"Num.tel.2: {row['Num.tel.2'].strip()}")
-        
-        if 'Fax' in row and row['Fax'].strip():
-            notes_parts.append(f"Fax: {row['Fax'].strip()}")
+        notes_parts = [
+            f"{csv_field}: {value}" for csv_field, odoo_field, value in row_values
+            if csv_field in ('Num.tel.2', 'Fax')
+        ]
         
         # Add notes if any special fields were found
         if notes_parts:
@@ -1361,119 +1705,137 @@ class DbmImportWizard(models.TransientModel):
         
         return partner_data
 
-    def _create_or_update_partner(self, partner_data):
+    def _queue_partner(self, partner_data, row_num, partner_index, pending_creates, pending_updates):
+        """
+        Queue prepared partner data for the bulk create/write done after the CSV pass.
+        Existing partners are matched by codice through partner_index.
+        """
+        # VAT and Codice Fiscale are written with SQL after the records exist, bypassing validation
+        vat_value = partner_data.pop('vat', None)
+        cf_value = partner_data.pop('l10n_it_codice_fiscale', None)
+        
+        existing_partner_id = partner_index.get(partner_data['ref'])
+        if existing_partner_id:
+            pending_updates[existing_partner_id] = {'vals': partner_data, 'row': row_num}
+        else:
+            pending_creates[partner_data['ref']] = {'vals': partner_data, 'row': row_num, 'vat': vat_value, 'cf': cf_value}
+
+    def _apply_partner_batch(self, pending_creates, pending_updates):
+        """
+        Write the queued partners in batches, then the VAT and Codice Fiscale of the
+        created ones with a single SQL update (existing partners keep theirs)
+        Returns (created, updated, errors), errors being (entry, exception) tuples.
+        """
+        created, updated, errors = self._write_import_batches('res.partner', pending_updates, list(pending_creates.values()))
+        
+        _logger.info("Partners batch applied: %s created, %s updated, %s errors", len(created), len(updated), len(errors))
+        
+        self._bulk_update_partner_vat_sql([(partner_id, entry['vat'], entry['cf']) for partner_id, entry in created])
+        
+        return [entry for partner_id, entry in created], [entry for partner_id, entry in updated], errors
+    
+    def _bulk_update_partner_vat_sql(self, vat_updates):
         """
-        Create or update partner record
-        Returns dict with action info: {'action': 'created'|'updated', 'partner': partner_record, 'vat': vat_value, 'cf': cf_value}
+        Write the VAT and Codice Fiscale of many partners with a single UPDATE ... FROM (VALUES ...) statement.
+        vat_updates is a list of (partner_id, vat_value, cf_value) tuples, empty values are skipped.
+        Falls back to the per-partner update (and its error logging) if the batch fails.
         """
-        # Extract VAT and Codice Fiscale before creating partner
-        vat_value = partner_data.pop('vat', None)
-        cf_value = partner_data.pop('l10n_it_codice_fiscale', None)
-        
+        vat_updates = [(partner_id, vat_value or None, cf_value or None) for partner_id, vat_value, cf_value in vat_updates if vat_value or cf_value]
+        if not vat_updates:
+            return
+        # Pending ORM writes must reach the table before it is updated behind the ORM's back
+        self.env['res.partner'].flush_model()
+        # The Codice Fiscale column only exists with the Italian localization, leave it out when unused
+        if any(cf_value for partner_id, vat_value, cf_value in vat_updates):
+            sql = """
+                UPDATE res_partner AS p
+                SET vat = COALESCE(v.vat, p.vat),
+                    l10n_it_codice_fiscale = COALESCE(v.cf, p.l10n_it_codice_fiscale),
+                    write_date = NOW()
+                FROM (VALUES %s) AS v(id, vat, cf)
+                WHERE p.id = v.id
+            """
+        else:
+            sql = """
+                UPDATE res_partner AS p
+                SET vat = v.vat, write_date = NOW()
+                FROM (VALUES %s) AS v(id, vat, cf)
+                WHERE p.id = v.id
+            """
         try:
-            # Check if partner already exists by codice or name
-            domain = []
-            if 'ref' in partner_data:
-                domain.append(('ref', '=', partner_data['ref']))
-            else:
-                domain.append(('name', '=', partner_data['name']))
-            
-            existing_partner = self.env['res.partner'].search(domain, limit=1)
-            
-            if existing_partner:
-                # Update existing partner without VAT and CF
-                try:
-                    existing_partner.write(partner_data)
-                except Exception as e:
-                    _logger.error(f"Error updating partner: {str(e)}")
-                    self.env.cr.rollback()
-
-                _logger.info(f"Updated partner: {partner_data.get('name')} (ID: {existing_partner.id})")
-                result = {'action': 'updated', 'partner': existing_partner, 'vat': vat_value, 'cf': cf_value}
-            else:
-                # Create new partner without VAT and CF
-                new_partner = self.env['res.partner'].create(partner_data)
-                _logger.info(f"Created new partner: {partner_data.get('name')} (ID: {new_partner.id})")
-                result = {'action': 'created', 'partner': new_partner, 'vat': vat_value, 'cf': cf_value}
-
-                self._update_partner_vat_cf_sql(result['partner'].id, vat_value, cf_value)
-                
-            
-            return result
-            
+            with self.env.cr.savepoint():
+                execute_values(self.env.cr._obj, sql, vat_updates, template="(%s, %s, %s)", page_size=1000)
+            _logger.info("Updated VAT/CF of %s partners with SQL", len(vat_updates))
         except Exception as e:
-            error_msg = f"Error creating/updating partner {partner_data.get('name', 'N/A')}: {str(e)}"
-            
-            # Log error to ir.logging
-            self._log_import_error(
-                error_type="Partner Create/Update Error",
-                message=error_msg,
-                details=f"Partner data: {partner_data}",
-                import_type="partners"
-            )
-            
-            _logger.error(error_msg)
-            raise ValidationError(f"Error creating/updating partner: {str(e)}")
-    
+            _logger.warning("Bulk VAT/CF update failed, retrying partner by partner: %s", e)
+            comments = {}
+            for partner_id, vat_value, cf_value in vat_updates:
+                errors = self._update_partner_vat_cf_sql(partner_id, vat_value, cf_value)
+                if errors:
+                    comments[partner_id] = "".join(errors)
+            self._append_partner_comments_sql(comments)
+        # The per-partner fallback may also have appended errors to the comments
+        Partner = self.env['res.partner']
+        fnames = ['vat', 'l10n_it_codice_fiscale', 'comment', 'write_date']
+        Partner.invalidate_model([fname for fname in fnames if fname in Partner._fields])
+
     def _update_partner_vat_cf_sql(self, partner_id, vat_value, cf_value):
         """
         Update partner VAT and Codice Fiscale using direct SQL to bypass validation.
-        If an error occurs, append the error message to the partner's 'comment' field (text), using SQL.
-        Handles VAT and CF separately, so if both are present and both fail, both errors are logged.
-        The comment is always appended (not overwritten).
+        Handles VAT and CF separately, so if both are present and both fail, both errors are reported.
+        Each statement runs in a savepoint, so a failure neither commits nor rolls back the import.
+        Returns the error messages to append to the partner's 'comment', see _append_partner_comments_sql.
         """
+        if vat_value and cf_value:
+            # Common case: write both in one statement, only split them up to find which one fails
+            try:
+                with self.env.cr.savepoint():
+                    sql = "UPDATE res_partner SET vat = %s, l10n_it_codice_fiscale = %s, write_date = NOW() WHERE id = %s"
+                    self.env.cr.execute(sql, (vat_value, cf_value, partner_id))
+                _logger.info("Updated partner %s with SQL - VAT: %s, CF: %s", partner_id, vat_value, cf_value)
+                return []
+            except Exception as e:
+                _logger.warning("Failed to update VAT and CF for partner %s with SQL, retrying separately: %s", partner_id, e)
+        
         # Try to update VAT first, then CF, so both can be attempted and errors logged individually
-        self.env.cr.commit()
+        errors = []
         if vat_value:
             try:
-                sql = "UPDATE res_partner SET vat = %s, write_date = NOW() WHERE id = %s"
-                self.env.cr.execute(sql, (vat_value, partner_id))
-                self.env.cr.commit()
-                _logger.info(f"Updated partner {partner_id} with SQL - VAT: {vat_value}")
+                with self.env.cr.savepoint():
+                    sql = "UPDATE res_partner SET vat = %s, write_date = NOW() WHERE id = %s"
+                    self.env.cr.execute(sql, (vat_value, partner_id))
+                _logger.info("Updated partner %s with SQL - VAT: %s", partner_id, vat_value)
             except Exception as e:
-                _logger.warning(f"Failed to update VAT for partner {partner_id} with SQL: {str(e)}")
-                self.env.cr.rollback()
-                # Log error in comment field (append, not overwrite)
-                try:
-                    comment_sql = """
-                        UPDATE res_partner
-                        SET comment = 
-                            CASE 
-                                WHEN comment IS NULL OR comment = '' THEN %s
-                                ELSE comment || %s
-                            END,
-                            write_date = NOW()
-                        WHERE id = %s
-                    """
-                    error_msg = f"Partita IVA non valida: {str(e)}\n"
-                    self.env.cr.execute(comment_sql, (error_msg, error_msg, partner_id))
-                except Exception as e2:
-                    _logger.warning(f"Failed to log VAT error in comment for partner {partner_id}: {str(e2)}")
+                _logger.warning("Failed to update VAT for partner %s with SQL: %s", partner_id, e)
+                errors.append(f"Partita IVA non valida: {str(e)}\n")
         if cf_value:
             try:
-                sql = "UPDATE res_partner SET l10n_it_codice_fiscale = %s, write_date = NOW() WHERE id = %s"
-                self.env.cr.execute(sql, (cf_value, partner_id))
-                self.env.cr.commit()
-                _logger.info(f"Updated partner {partner_id} with SQL - CF: {cf_value}")
+                with self.env.cr.savepoint():
+                    sql = "UPDATE res_partner SET l10n_it_codice_fiscale = %s, write_date = NOW() WHERE id = %s"
+                    self.env.cr.execute(sql, (cf_value, partner_id))
+                _logger.info("Updated partner %s with SQL - CF: %s", partner_id, cf_value)
             except Exception as e:
-                _logger.warning(f"Failed to update Codice Fiscale for partner {partner_id} with SQL: {str(e)}")
-                # Log error in comment field (append, not overwrite)
-                self.env.cr.rollback()
-                try:
-                    comment_sql = """
-                        UPDATE res_partner
-                        SET comment = 
-                            CASE 
-                                WHEN comment IS NULL OR comment = '' THEN %s
-                                ELSE comment || %s
-                            END,
-                            write_date = NOW()
-                        WHERE id = %s
-                    """
-                    error_msg = f"Codice Fiscale non valido: {cf_value}\n"
-                    self.env.cr.execute(comment_sql, (error_msg, error_msg, partner_id))
-                except Exception as e2:
-                    _logger.warning(f"Failed to log CF error in comment for partner {partner_id}: {str(e2)}")
+                _logger.warning("Failed to update Codice Fiscale for partner %s with SQL: %s", partner_id, e)
+                errors.append(f"Codice Fiscale non valido: {cf_value}\n")
+        return errors
+
+    def _append_partner_comments_sql(self, comments):
+        """
+        Append messages to the 'comment' field (text) of partners with a single SQL statement.
+        comments maps partner ids to the message to append, the comment is never overwritten.
+        """
+        if not comments:
+            return
+        try:
+            with self.env.cr.savepoint():
+                execute_values(self.env.cr._obj, """
+                    UPDATE res_partner AS p
+                    SET comment = COALESCE(p.comment, '') || v.message, write_date = NOW()
+                    FROM (VALUES %s) AS v(id, message)
+                    WHERE p.id = v.id
+                """, list(comments.items()), template="(%s, %s)", page_size=1000)
+        except Exception as e:
+            _logger.warning("Failed to log VAT/CF errors in comment for partners %s: %s", list(comments), e)
 
     def action_import_file(self):
         """
@@ -1489,104 +1851,54 @@ class DbmImportWizard(models.TransientModel):
         
         return self.import_file(self.file, self.table_import)
 
-    def _prepare_project_data(self, row, field_mapping):
+    def _prepare_project_data(self, row, idx_map, partner_by_name, stage_names):
         """
         Prepare project data from CSV row
+        partner_by_name maps lowercased partner names to ids, see _partner_name_index,
+        stage_names maps project stage names to ids, see _get_or_create_by_name
         """
         project_data = {}
-        _logger.info(f"Preparing project data from row: {row}")
+        _logger.debug("Preparing project data from row: %s", row)
         
-        for csv_field, odoo_field in field_mapping.items():
-            if csv_field in row and row[csv_field].strip():
-                value = row[csv_field].strip()
-                
-                # Special handling for specific fields
-                if odoo_field == 'partner_id':
-                    # Find partner by name
-                    partner = self.env['res.partner'].search([
-                        ('name', 'ilike', value)
-                    ], limit=1)
-                    if partner:
-                        project_data[odoo_field] = partner.id
-                    else:
-                        _logger.warning(f"Partner '{value}' not found")
-                elif odoo_field == 'stage_id':
-                    # Mappa standardizzata per le fasi progetto
-                    # Se esistono già: Da fare, In corso, Completato, Annullato
-                    # Se arriva per esempio "In Progress" o "Closed", mappali su quelli esistenti
-                    standard_stage_map = {
-                        'DA FARE': 'Da fare',
-                        'TO DO': 'Da fare',
-                        'IN CORSO': 'In corso',
-                        'IN PROGRESS': 'In corso',
-                        'COMPLETATO': 'Completato',
-                        'COMPLETED': 'Completato',
-                        'CHIUSO': 'Completato',
-                        'ANNULLATO': 'Annullato',
-                        'CANCELLED': 'Annullato',
-                        'CANCELED': 'Annullato',
-                    }
-                    stage_key = value.strip().upper()
-                    stage_name = standard_stage_map.get(stage_key)
-                    if not stage_name:
-                        # Se non è nella mappa, usa il valore originale come nome stage
-                        stage_name = value.strip()
-                        _logger.info(f"Stage '{stage_name}' non presente in mappa, verrà creato come nuovo stage.")
-                    # Cerca se esiste già uno stage con questo nome
-                    stage = self.env['project.project.stage'].search([('name', '=', stage_name)], limit=1)
-                    if not stage:
-                        # Crea lo stage se non esiste
-                        stage = self.env['project.project.stage'].create({'name': stage_name})
-                        _logger.info(f"Creato nuovo project stage: {stage_name}")
-                    project_data[odoo_field] = stage.id
-                elif odoo_field == 'priority':
-                    # Map priority
-                    priority_mapping = {
-                        'ALTA': '1',
-                        'MEDIA': '0',
-                        'BASSA': '-1',
-                    }
-                    priority_name = value.upper()
-                    if priority_name in priority_mapping:
-                        project_data[odoo_field] = priority_mapping[priority_name]
-                    else:
-                        project_data[odoo_field] = '0'  # Default to medium
-                elif odoo_field in ['date_start', 'date_end', 'date']:
-                    # Parse dates
-                    try:
-                        # Try different date formats, including the specific format from CSV
-                        date_formats = [
-                            '%d/%m/%Y %H:%M',      # 31/03/2024 1:00
-                            '%d/%m/%Y %H:%M:%S',   # 31/03/2024 1:00:00
-                            '%d/%m/%Y',            # 31/03/2024
-                            '%Y-%m-%d %H:%M:%S',   # 2024-03-31 01:00:00
-                            '%Y-%m-%d %H:%M',      # 2024-03-31 01:00
-                            '%Y-%m-%d',            # 2024-03-31
-                            '%d-%m-%Y %H:%M',      # 31-03-2024 1:00
-                            '%d-%m-%Y',            # 31-03-2024
-                        ]
-                        parsed_date = None
-                        
-                        for date_format in date_formats:
-                            try:
-                                parsed_date = datetime.strptime(value, date_format)
-                                break
-                            except ValueError:
-                                continue
-                        
-                        if parsed_date:
-                            # Convert to Odoo datetime format
-                            project_data[odoo_field] = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
-                            _logger.info(f"Successfully parsed date '{value}' as '{project_data[odoo_field]}' for field {odoo_field}")
-                        else:
-                            _logger.warning(f"Unable to parse date '{value}' for field {odoo_field}. Supported formats: DD/MM/YYYY HH:MM, DD/MM/YYYY, YYYY-MM-DD HH:MM:SS")
-                    except Exception as e:
-                        _logger.warning(f"Error parsing date '{value}': {str(e)}")
+        for csv_field, odoo_field, value in self._csv_row_values(row, idx_map):
+            # Special handling for specific fields
+            if odoo_field == 'partner_id':
+                # Find partner by name
+                partner_id = self._match_partner_name(value, partner_by_name)
+                if partner_id:
+                    project_data[odoo_field] = partner_id
                 else:
-                    project_data[odoo_field] = value
-        
+                    _logger.warning("Partner '%s' not found", value)
+            elif odoo_field == 'stage_id':
+                # Stages are found or created for the whole file before the rows are processed
+                stage_name = _PROJECT_STAGE_MAP.get(value.upper(), value)
+                stage_id = stage_names.get(stage_name)
+                if not stage_id:
+                    stage_id = stage_names[stage_name] = self.env['project.project.stage'].create({'name': stage_name}).id
+                    _logger.info("Creato nuovo project stage: %s", stage_name)
+                project_data[odoo_field] = stage_id
+            elif odoo_field == 'priority':
+                # Map priority, default to medium
+                project_data[odoo_field] = _PROJECT_PRIORITY_MAP.get(value.upper(), '0')
+            elif odoo_field in ['date_start', 'date_end', 'date']:
+                # Parse dates
+                try:
+                    # Try different date formats, including the specific format from CSV
+                    parsed_date = _parse_date(value)
+                    
+                    if parsed_date:
+                        # Convert to Odoo datetime format
+                        project_data[odoo_field] = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
+                        _logger.debug("Successfully parsed date '%s' as '%s' for field %s", value, project_data[odoo_field], odoo_field)
+                    else:
+                        _logger.warning("Unable to parse date '%s' for field %s. Supported formats: DD/MM/YYYY HH:MM, DD/MM/YYYY, YYYY-MM-DD HH:MM:SS", value, odoo_field)
+                except Exception as e:
+                    _logger.warning("Error parsing date '%s': %s", value, e)
+            else:
+                project_data[odoo_field] = value
+    
         # Set default values and validate required fields
-        if 'name' not in project_data or not project_data['name'].strip():
+        if not project_data.get('name'):
             error_msg = "Project name (Commessa) is required"
             self._log_import_error(
                 error_type="Project Validation Error",
@@ -1602,9 +1914,9 @@ class DbmImportWizard(models.TransientModel):
                 try:
                     # Validate that the date string is properly formatted for Odoo
                     datetime.strptime(project_data[date_field], '%Y-%m-%d %H:%M:%S')
-                    _logger.info(f"Date validation successful for {date_field}: {project_data[date_field]}")
+                    _logger.debug("Date validation successful for %s: %s", date_field, project_data[date_field])
                 except ValueError:
-                    _logger.warning(f"Invalid date format for {date_field}: {project_data[date_field]}. Expected format: YYYY-MM-DD HH:MM:SS")
+                    _logger.warning("Invalid date format for %s: %s. Expected format: YYYY-MM-DD HH:MM:SS", date_field, project_data[date_field])
                     # Remove invalid date instead of failing
                     del project_data[date_field]
         
@@ -1612,66 +1924,9 @@ class DbmImportWizard(models.TransientModel):
         if 'type_dbm' not in project_data:
             project_data['type_dbm'] = 'GENERICO'
         
-        _logger.info(f"Final project data prepared: {project_data}")
+        _logger.debug("Final project data prepared: %s", project_data)
         return project_data
 
-    def _create_or_update_project(self, project_data):
-        """
-        Create or update project record
-        Returns dict with action info: {'action': 'created'|'updated', 'project': project_record}
-        """
-        try:
-            _logger.info(f"Attempting to create/update project with data: {project_data}")
-            
-            # Check if project already exists by code or name
-            domain = []
-            if 'code' in project_data and project_data['code']:
-                domain.append(('code', '=', project_data['code']))
-                _logger.info(f"Searching for existing project by code: {project_data['code']}")
-            else:
-                domain.append(('name', '=', project_data['name']))
-                _logger.info(f"Searching for existing project by name: {project_data['name']}")
-            
-            existing_project = self.env['project.project'].search(domain, limit=1)
-            _logger.info(f"Found existing project: {existing_project}")
-            
-            if existing_project:
-                # Update existing project
-                _logger.info(f"Updating existing project ID: {existing_project.id}")
-                existing_project.write(project_data)
-                existing_project.user_id = self.user_id.id
-                _logger.info(f"Successfully updated project: {project_data.get('name')} (ID: {existing_project.id})")
-                return {'action': 'updated', 'project': existing_project}
-            else:
-                # Create new project
-                _logger.info(f"Creating new project with data: {project_data}")
-                new_project = self.env['project.project'].create(project_data)
-                _logger.info(f"Successfully created new project: {project_data.get('name')} (ID: {new_project.id})")
-
-                new_project.user_id = self.user_id.id
-                
-                # Verify the project was actually created
-                if new_project.exists():
-                    _logger.info(f"Project creation verified - ID: {new_project.id}, Name: {new_project.name}")
-                else:
-                    _logger.error("Project creation failed - record does not exist after creation")
-                    raise ValidationError("Project creation failed - record does not exist after creation")
-                
-                return {'action': 'created', 'project': new_project}
-        except Exception as e:
-            error_msg = f"Error creating/updating project {project_data.get('name', 'N/A')}: {str(e)}"
-            
-            # Log error to ir.logging
-            self._log_import_error(
-                error_type="Project Create/Update Error",
-                message=error_msg,
-                details=f"Project data: {project_data}",
-                import_type="projects"
-            )
-            
-            _logger.error(error_msg)
-            raise ValidationError(f"Error creating/updating project: {str(e)}")
-
     def _import_activities(self, file_data):
         """
         Import activities from CSV file using project.task
@@ -1684,79 +1939,47 @@ class DbmImportWizard(models.TransientModel):
             file_content = base64.b64decode(file_data)
             
             # Get delimiter
-            delimiter_map = {
-                'comma': ',',
-                'semicolon': ';',
-                'tab': '\t'
-            }
-            delimiter = delimiter_map.get(self.delimiter, ',')
-            
-            # Handle file encoding
-            if self.file_encoding == 'auto':
-                # Try different encodings to handle various file formats
-                encodings_to_try = ['utf-8', 'utf-8-sig', 'cp1252', 'iso-8859-1', 'latin1']
-                csv_content = None
-                
-                for encoding in encodings_to_try:
-                    try:
-                        csv_content = file_content.decode(encoding)
-                        _logger.info(f"Successfully decoded file using encoding: {encoding}")
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if csv_content is None:
-                    raise UserError("Unable to decode the file. Please try selecting a specific encoding or save the file with UTF-8 encoding.")
-            else:
-                # Use user-selected encoding
-                try:
-                    csv_content = file_content.decode(self.file_encoding)
-                    _logger.info(f"Successfully decoded file using user-selected encoding: {self.file_encoding}")
-                except UnicodeDecodeError as e:
-                    raise UserError(f"Unable to decode the file using {self.file_encoding} encoding. Error: {str(e)}")
+            delimiter = _DELIMITER_MAP.get(self.delimiter, ',')
             
-            # Parse CSV
-            csv_file = io.StringIO(csv_content)
-            reader = csv.DictReader(csv_file, delimiter=delimiter)
+            # Parse CSV, decoding lines lazily while reading
+            csv_file = self._open_csv_text(file_content)
+            delimiter = self._csv_delimiter(csv_file, delimiter)
+            reader = csv.reader(csv_file, delimiter=delimiter)
+            header = next(reader, [])
             
-            # Field mapping for CSV columns to Odoo fields
-            field_mapping = {
-                'Attività': 'name',
-                'Azienda': 'partner_id',
-                'In carico a': 'user_ids',
-                'Data': 'planned_date_start',
-                'Fatta/da fare': 'stage_id',
-                'Macro tipo': 'tag_ids',
-                'Commessa': 'project_id',
-                'Descrizione attività': 'description',
-                'Tipo attività': 'tag_ids',
-                'Referente': 'partner_ref_id',
-            }
+            idx_map = self._csv_index_map(header, _ACTIVITY_FIELD_MAPPING)
             
-            created_count = 0
-            updated_count = 0
             error_count = 0
             errors = []
-            created_activities = []
-            updated_activities = []
             
-            for row_num, row in enumerate(reader, start=2):  # Start from 2 if header exists
+            # Name lookups shared by all rows instead of reading the tables for every row.
+            # The tags and stages used by the file are found or created once, before the rows.
+            rows = list(enumerate(reader, start=2))  # Start from 2 if header exists
+            tag_names = self._get_or_create_by_name('project.tags', self._csv_mapped_values(rows, idx_map, 'tag_ids'))
+            stage_names = self._get_or_create_by_name('project.task.type', {
+                _ACTIVITY_STAGE_MAP.get(stage.upper(), stage) for stage in self._csv_mapped_values(rows, idx_map, 'stage_id')
+            })
+            user_names = {user.name: user.id for user in self.env['res.users'].search_fetch([], ['name'])}
+            partner_by_name = self._partner_name_index()
+            # Project codes resolved along the import, each code is searched only once
+            project_ids = {}
+            # CSV dates are in the user's timezone, or UTC if not set
+            local_tz = pytz.timezone(self.env.user.tz or 'UTC')
+            
+            # Rows are only prepared here, activities are created in bulk after the CSV pass
+            pending_creates = []
+            activity_name_cell = self._csv_cell_getter(header, 'Attività')
+            project_code_cell = self._csv_cell_getter(header, 'Commessa')
+            for row_num, row in rows:
                 try:
-                    activity_data = self._prepare_activity_data(row, field_mapping)
+                    activity_data = self._prepare_activity_data(row, idx_map, tag_names, stage_names, user_names, partner_by_name, project_ids, local_tz)
                     if activity_data:
-                        result = self._create_or_update_activity(activity_data)
-                        if result['action'] == 'created':
-                            created_count += 1
-                            created_activities.append(f"{activity_data.get('name', 'N/A')} (Commessa: {activity_data.get('project_code', 'N/A')})")
-                            _logger.info(f"{row_num} - Created activity: {activity_data.get('name', 'N/A')}")
-                        elif result['action'] == 'updated':
-                            updated_count += 1
-                            updated_activities.append(f"{activity_data.get('name', 'N/A')} (Commessa: {activity_data.get('project_code', 'N/A')})")
+                        pending_creates.append({'vals': activity_data, 'row': row_num})
                     
                 except Exception as e:
                     error_count += 1
-                    activity_name = row.get('Attività', 'N/A')
-                    project_code = row.get('Commessa', 'N/A')
+                    activity_name = activity_name_cell(row)
+                    project_code = project_code_cell(row)
                     error_msg = f"Row {row_num} - {activity_name} (Commessa: {project_code}): {str(e)}"
                     errors.append(error_msg)
                     
@@ -1769,45 +1992,45 @@ class DbmImportWizard(models.TransientModel):
                         import_type="activities"
                     )
                     
-                    _logger.error(f"Error importing activity at row {row_num}: {str(e)}")
+                    _logger.error("Error importing activity at row %s: %s", row_num, e)
+            
+            # Activities are always created, existing ones are not looked up
+            created, updated, batch_errors = self._write_import_batches('project.task', {}, pending_creates)
+            created_count = len(created)
+            updated_count = len(updated)
+            created_activities = [f"{entry['vals'].get('name', 'N/A')} (Commessa: {entry['vals'].get('project_code', 'N/A')})" for task_id, entry in created]
+            updated_activities = []
+            for entry, e in batch_errors:
+                error_count += 1
+                error_msg = f"Row {entry['row']} - {entry['vals'].get('name', 'N/A')} (Commessa: {entry['vals'].get('project_code', 'N/A')}): {str(e)}"
+                errors.append(error_msg)
+                self._log_import_error(
+                    error_type="Activity Create Error",
+                    message=error_msg,
+                    details=f"Activity data: {entry['vals']}",
+                    row_number=entry['row'],
+                    import_type="activities"
+                )
+                _logger.error("Error creating activity at row %s: %s", entry['row'], e)
             
             # Update note with detailed results
-            result_message = f"Import attività completato:\n"
-            result_message += f"- Attività create: {created_count}\n"
-            result_message += f"- Attività aggiornate: {updated_count}\n"
-            result_message += f"- Errori: {error_count}\n"
-            
-            # Show created activities
-            if created_activities:
-                result_message += f"\nAttività create:\n"
-                for activity in created_activities[:10]:  # Show first 10
-                    result_message += f"- {activity}\n"
-                if len(created_activities) > 10:
-                    result_message += f"... e altre {len(created_activities) - 10} attività create\n"
-            
-            # Show updated activities
-            if updated_activities:
-                result_message += f"\nAttività aggiornate:\n"
-                for activity in updated_activities[:10]:  # Show first 10
-                    result_message += f"- {activity}\n"
-                if len(updated_activities) > 10:
-                    result_message += f"... e altre {len(updated_activities) - 10} attività aggiornate\n"
-            
-            # Show errors
-            if errors:
-                result_message += f"\nErrori riscontrati:\n"
-                for error in errors[:10]:  # Show first 10 errors
-                    result_message += f"- {error}\n"
-                if len(errors) > 10:
-                    result_message += f"... e altri {len(errors) - 10} errori\n"
-            
-            self.note = result_message
+            result_lines = [
+                "Import attività completato:",
+                f"- Attività create: {created_count}",
+                f"- Attività aggiornate: {updated_count}",
+                f"- Errori: {error_count}",
+            ]
+            result_lines += self._result_section("Attività create", created_activities, created_count, "e altre {} attività create")
+            result_lines += self._result_section("Attività aggiornate", updated_activities, updated_count, "e altre {} attività aggiornate")
+            result_lines += self._result_section("Errori riscontrati", errors, len(errors), "e altri {} errori")
+            self.note = "\n".join(result_lines) + "\n"
             
             # Prepare notification message
             notification_msg = f"Create: {created_count}, Aggiornate: {updated_count}"
             if error_count > 0:
                 notification_msg += f", Errori: {error_count}"
             
+            self._flush_import_errors()
             self.env.cr.commit()
 
 
@@ -1844,153 +2067,119 @@ class DbmImportWizard(models.TransientModel):
             _logger.error(error_msg)
             raise UserError(error_msg)
 
-    def _prepare_activity_data(self, row, field_mapping):
+    def _prepare_activity_data(self, row, idx_map, tag_names, stage_names, user_names, partner_by_name, project_ids, local_tz):
         """
         Prepare activity data from CSV row
+        tag_names, stage_names and user_names map names to ids, they are loaded once
+        per import and extended with the tags and stages created along the way,
+        partner_by_name maps lowercased partner names to ids, see _partner_name_index,
+        project_ids memoizes the project id (or False) of each project code,
+        local_tz is the timezone the CSV dates are expressed in
         """
         activity_data = {}
-        #_logger.info(f"Preparing activity data from row: {row}")
-
-        tag_names = {i.name:i.id for i in self.env['project.tags'].search([])}
-        stage_names = {i.name:i.id for i in self.env['project.task.type'].search([])}
-        user_names = {i.name:i.id for i in self.env['res.users'].search([])}
+        #_logger.debug("Preparing activity data from row: %s", row)
         
-        for csv_field, odoo_field in field_mapping.items():
-            if csv_field in row and row[csv_field].strip():
-                value = row[csv_field].strip()
+        for csv_field, odoo_field, value in self._csv_row_values(row, idx_map):
+            # Special handling for specific fields
+            if odoo_field == 'partner_id':
+                # Find company by name
+                company_id = self._match_partner_name(value, partner_by_name)
+                if company_id:
+                    activity_data[odoo_field] = company_id
+                else:
+                    _logger.warning("Company '%s' not found", value)
+            elif odoo_field == 'partner_ref_id':
+                # Find person by name
+                person_id = self._match_partner_name(value, partner_by_name)
+                if person_id:
+                    activity_data[odoo_field] = person_id
+                else:
+                    _logger.warning("Person '%s' not found", value)
+            elif odoo_field == 'user_ids':
+                # Set only the user found, removing others
+                user = user_names.get(value, False)
+                if user:
+                    activity_data[odoo_field] = [(6, 0, [user])]
+                else:
+                    # Use current user if not found
+                    activity_data[odoo_field] = [(6, 0, [self.env.user.id])]
+            elif odoo_field == 'stage_id':
+                # Map stage names to project.task.stage
+                stage_key = value.upper()
+                stage_name = _ACTIVITY_STAGE_MAP.get(stage_key, value)
                 
-                # Special handling for specific fields
-                if odoo_field == 'partner_id':
-                    # Find company by name
-                    company = self.env['res.partner'].search([
-                        ('name', 'ilike', value),
-                    ], limit=1)
-                    if company:
-                        activity_data[odoo_field] = company.id
-                    else:
-                        _logger.warning(f"Company '{value}' not found")
-                elif odoo_field == 'partner_ref_id':
-                    # Find person by name
-                    person = self.env['res.partner'].search([
-                        ('name', 'ilike', value),
-                    ], limit=1)
-                    if person:
-                        activity_data[odoo_field] = person.id
-                    else:
-                        _logger.warning(f"Person '{value}' not found")
-                elif odoo_field == 'user_ids':
-                    # Set only the user found, removing others
-                    user = user_names.get(value, False)
-                    if user:
-                        activity_data[odoo_field] = [(6, 0, [user])]
-                    else:
-                        # Use current user if not found
-                        activity_data[odoo_field] = [(6, 0, [self.env.user.id])]
-                elif odoo_field == 'stage_id':
-                    # Map stage names to project.task.stage
-                    stage_mapping = {
-                        'ANNULLATA': 'Annullata',
-                        'TO DO': 'Attività da fare',
-                        'COMPLETED': 'Attività fatta',
-                    }
-                    stage_key = value.strip().upper()
-                    stage_name = stage_mapping.get(stage_key, value.strip())
-                    
-                    # Find stage in project.task.stage
-                    stage = stage_names.get(stage_name, False)
-                    if not stage:
-                        # Use default stage if not found
-                        stage = self.env['project.task.type'].create({
-                            'name': stage_name
+                # Find stage in project.task.stage
+                stage = stage_names.get(stage_name, False)
+                if not stage:
+                    # Use default stage if not found
+                    stage = self.env['project.task.type'].create({
+                        'name': stage_name
+                    }).id
+                    stage_names[stage_name] = stage
+                    #_logger.warning("Stage '%s' not found, created new stage", stage_name)
+                if stage:
+                    activity_data[odoo_field] = stage
+                    if stage_key == 'ATTIVITÀ FATTA':
+                        activity_data['state'] = '1_done'
+            elif odoo_field == 'tag_ids':
+                if value:
+                    tag_id = tag_names.get(value, False)
+                    if not tag_id:
+                        tag_id = self.env['project.tags'].create({
+                            'name': value
                         }).id
-                        stage_names[stage_name] = stage
-                        #_logger.warning(f"Stage '{stage_name}' not found, created new stage")
-                    if stage:
-                        activity_data[odoo_field] = stage
-                        if stage_key == 'ATTIVITÀ FATTA':
-                            activity_data['state'] = '1_done'
-                elif odoo_field == 'tag_ids':
-                    if value:
-                        tag_id = tag_names.get(value, False)
-                        if not tag_id:
-                            tag_id = self.env['project.tags'].create({
-                                'name': value
-                            }).id
-                            _logger.warning(f"Tag '{value}' not found, created new tag")
-                            tag_names[value] = tag_id
-                        if tag_id not in [i[1] for i in activity_data.get(odoo_field, [])]:
-                            if activity_data.get(odoo_field, []):
-                                activity_data[odoo_field].append((4, tag_id))
-                            else:
-                                activity_data[odoo_field] = [(4, tag_id)]
-                elif odoo_field == 'planned_date_start':
-                    # Parse dates and convert to UTC to avoid timezone issues
-                    try:
-                        import pytz
-                        date_formats = [
-                            '%d/%m/%Y %H:%M',      # 31/03/2024 1:00
-                            '%d/%m/%Y %H:%M:%S',   # 31/03/2024 1:00:00
-                            '%d/%m/%Y',            # 31/03/2024
-                            '%Y-%m-%d %H:%M:%S',   # 2024-03-31 01:00:00
-                            '%Y-%m-%d %H:%M',      # 2024-03-31 01:00
-                            '%Y-%m-%d',            # 2024-03-31
-                            '%d-%m-%Y %H:%M',      # 31-03-2024 1:00
-                            '%d-%m-%Y',            # 31-03-2024
-                        ]
-                        parsed_date = None
-
-                        for date_format in date_formats:
-                            try:
-                                parsed_date = datetime.strptime(value, date_format)
-                                break
-                            except ValueError:
-                                continue
-
-                        if parsed_date:
-                            # Get user's timezone or default to UTC
-                            user_tz = self.env.user.tz or 'UTC'
-                            local_tz = pytz.timezone(user_tz)
-                            # If the parsed date has no time, set to 00:00
-                            if parsed_date.hour == 0 and parsed_date.minute == 0 and parsed_date.second == 0 and ('%H' not in date_format):
-                                parsed_date = parsed_date.replace(hour=0, minute=0, second=0)
-                            # Localize and convert to UTC
-                            localized_date = local_tz.localize(parsed_date)
-                            utc_date = localized_date.astimezone(pytz.utc)
-                            activity_data[odoo_field] = utc_date.strftime('%Y-%m-%d %H:%M:%S')
-                            #_logger.info(f"Successfully parsed date '{value}' as '{activity_data[odoo_field]}' (UTC, user tz: {user_tz})")
-                        else:
-                            _logger.warning(f"Unable to parse date '{value}'. Supported formats: DD/MM/YYYY HH:MM, DD/MM/YYYY, YYYY-MM-DD HH:MM:SS")
-                    except Exception as e:
-                        _logger.warning(f"Error parsing date '{value}': {str(e)}")
-                elif odoo_field == 'project_id':
-                    # Extract the project code by removing the suffix (e.g., "000001-24" from "PROJECT_NAME-000001-24")
-                    project_code = value
-                    if '-' in project_code:
-                        # Split by '-' and take all parts except the last one (which is the suffix)
-                        code_parts = project_code.split('-')
-                        if len(code_parts) > 1:
-                            # Remove the last part (suffix like "000001-24")
-                            clean_project_code = '-'.join(code_parts[:-1])
+                        _logger.warning("Tag '%s' not found, created new tag", value)
+                        tag_names[value] = tag_id
+                    if tag_id not in [i[1] for i in activity_data.get(odoo_field, [])]:
+                        if activity_data.get(odoo_field, []):
+                            activity_data[odoo_field].append((4, tag_id))
                         else:
-                            clean_project_code = project_code
+                            activity_data[odoo_field] = [(4, tag_id)]
+            elif odoo_field == 'planned_date_start':
+                # Parse dates and convert to UTC to avoid timezone issues
+                try:
+                    parsed_date = _parse_date(value)
+
+                    if parsed_date:
+                        # Localize in the user's timezone and convert to UTC
+                        localized_date = local_tz.localize(parsed_date)
+                        utc_date = localized_date.astimezone(pytz.utc)
+                        activity_data[odoo_field] = utc_date.strftime('%Y-%m-%d %H:%M:%S')
+                        #_logger.debug("Successfully parsed date '%s' as '%s' (UTC, user tz: %s)", value, activity_data[odoo_field], local_tz)
+                    else:
+                        _logger.warning("Unable to parse date '%s'. Supported formats: DD/MM/YYYY HH:MM, DD/MM/YYYY, YYYY-MM-DD HH:MM:SS", value)
+                except Exception as e:
+                    _logger.warning("Error parsing date '%s': %s", value, e)
+            elif odoo_field == 'project_id':
+                # Extract the project code by removing the suffix (e.g., "000001-24" from "PROJECT_NAME-000001-24")
+                project_code = value
+                if '-' in project_code:
+                    # Split by '-' and take all parts except the last one (which is the suffix)
+                    code_parts = project_code.split('-')
+                    if len(code_parts) > 1:
+                        # Remove the last part (suffix like "000001-24")
+                        clean_project_code = '-'.join(code_parts[:-1])
                     else:
                         clean_project_code = project_code
-                    if clean_project_code:
-                        project = self.env['project.project'].search([('code', '=', clean_project_code.strip())], limit=1)
-                        if project:
-                            activity_data[odoo_field] = project.id
-                        else:
-                            _logger.warning(f"Project '{clean_project_code}' not found")
-                elif odoo_field == 'name':
-                    activity_data[odoo_field] = value.strip()
-                elif odoo_field == 'planned_hours':
-                    # Parse time duration (skip for now as requested)
-                    continue
                 else:
-                    activity_data[odoo_field] = value
-        
+                    clean_project_code = project_code
+                if clean_project_code:
+                    clean_project_code = clean_project_code.strip()
+                    if clean_project_code not in project_ids:
+                        project = self.env['project.project'].search([('code', '=', clean_project_code)], limit=1)
+                        project_ids[clean_project_code] = project.id
+                        if not project:
+                            _logger.warning("Project '%s' not found", clean_project_code)
+                    if project_ids[clean_project_code]:
+                        activity_data[odoo_field] = project_ids[clean_project_code]
+            elif odoo_field == 'planned_hours':
+                # Parse time duration (skip for now as requested)
+                continue
+            else:
+                activity_data[odoo_field] = value
+    
         # Set default values and validate required fields
-        if 'name' not in activity_data or not activity_data['name'].strip():
+        if not activity_data.get('name'):
             error_msg = "Activity name (Attività) is required"
             self._log_import_error(
                 error_type="Activity Validation Error",
@@ -2000,67 +2189,9 @@ class DbmImportWizard(models.TransientModel):
             )
             raise ValidationError(error_msg)
         
-        _logger.info(f"Final activity data prepared: {activity_data}")
+        _logger.debug("Final activity data prepared: %s", activity_data)
         return activity_data
 
-    def _create_or_update_activity(self, activity_data):
-        """
-        Create or update activity record using project.task
-        Returns dict with action info: {'action': 'created'|'updated', 'activity': activity_record}
-        """
-        try:
-            _logger.info(f"Attempting to create/update activity with data: {activity_data}")
-            
-            # Check if activity already exists by name and project_code
-            domain = [('name', '=', activity_data['name'])]
-            if 'project_id' in activity_data and activity_data['project_id']:
-                # Extract the project code by removing the suffix (e.g., "000001-24" from "PROJECT_NAME-000001-24")
-                               
-                project = activity_data['project_id']
-                if project:
-                    domain.append(('project_id', '=', project))
-                else:
-                    _logger.warning(f"Project '{activity_data['project_id']}' not found")
-            
-            #existing_activity = self.env['project.task'].search(domain, limit=1)
-            existing_activity = False
-            _logger.info(f"Found existing activity: {existing_activity}")
-            
-            if existing_activity:
-                # Update existing activity
-                _logger.info(f"Updating existing activity ID: {existing_activity.id}")
-                existing_activity.write(activity_data)
-                _logger.info(f"Successfully updated activity: {activity_data.get('name')} (ID: {existing_activity.id})")
-                return {'action': 'updated', 'activity': existing_activity}
-            else:
-                # Create new activity
-                _logger.info(f"Creating new activity with data: {activity_data}")
-                new_activity = self.env['project.task'].create(activity_data)
-                
-                _logger.info(f"Successfully created new activity: {activity_data.get('name')} (ID: {new_activity.id})")
-                
-                # Verify the activity was actually created
-                if new_activity.exists():
-                    _logger.info(f"Activity creation verified - ID: {new_activity.id}, Name: {new_activity.name}")
-                else:
-                    _logger.error("Activity creation failed - record does not exist after creation")
-                    raise ValidationError("Activity creation failed - record does not exist after creation")
-                
-                return {'action': 'created', 'activity': new_activity}
-        except Exception as e:
-            error_msg = f"Error creating/updating activity {activity_data.get('name', 'N/A')}: {str(e)}"
-            
-            # Log error to ir.logging
-            self._log_import_error(
-                error_type="Activity Create/Update Error",
-                message=error_msg,
-                details=f"Activity data: {activity_data}",
-                import_type="activities"
-            )
-            
-            _logger.error(error_msg)
-            raise ValidationError(f"Error creating/updating activity: {str(e)}")
-
     def _import_helpdesk_tickets(self, file_data):
         """
         Import helpdesk tickets from CSV file
@@ -2069,8 +2200,7 @@ class DbmImportWizard(models.TransientModel):
         self.env.cr.commit()
         
         # Check if helpdesk module is installed
-        helpdesk_module = self.env['ir.module.module'].search([('name', '=', 'helpdesk_mgmt'), ('state', '=', 'installed')])
-        if not helpdesk_module:
+        if not self._is_module_installed('helpdesk_mgmt'):
             raise UserError("The 'helpdesk_mgmt' module is not installed. Please install it first to import helpdesk tickets.")
         
         _logger.info("Helpdesk module is installed, proceeding with import")
@@ -2080,53 +2210,15 @@ class DbmImportWizard(models.TransientModel):
             file_content = base64.b64decode(file_data)
             
             # Get delimiter
-            delimiter_map = {
-                'comma': ',',
-                'semicolon': ';',
-                'tab': '\t'
-            }
-            delimiter = delimiter_map.get(self.delimiter, ',')
-            
-            # Handle file encoding
-            if self.file_encoding == 'auto':
-                # Try different encodings to handle various file formats
-                encodings_to_try = ['utf-8', 'utf-8-sig', 'cp1252', 'iso-8859-1', 'latin1']
-                csv_content = None
-                
-                for encoding in encodings_to_try:
-                    try:
-                        csv_content = file_content.decode(encoding)
-                        _logger.info(f"Successfully decoded file using encoding: {encoding}")
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if csv_content is None:
-                    raise UserError("Unable to decode the file. Please try selecting a specific encoding or save the file with UTF-8 encoding.")
-            else:
-                # Use user-selected encoding
-                try:
-                    csv_content = file_content.decode(self.file_encoding)
-                    _logger.info(f"Successfully decoded file using user-selected encoding: {self.file_encoding}")
-                except UnicodeDecodeError as e:
-                    raise UserError(f"Unable to decode the file using {self.file_encoding} encoding. Error: {str(e)}")
+            delimiter = _DELIMITER_MAP.get(self.delimiter, ',')
             
-            # Parse CSV
-            csv_file = io.StringIO(csv_content)
-            reader = csv.DictReader(csv_file, delimiter=delimiter)
+            # Parse CSV, decoding lines lazily while reading
+            csv_file = self._open_csv_text(file_content)
+            delimiter = self._csv_delimiter(csv_file, delimiter)
+            reader = csv.reader(csv_file, delimiter=delimiter)
+            header = next(reader, [])
             
-            # Field mapping for CSV columns to Odoo fields
-            field_mapping = {
-                'Oggetto': 'name',
-                'Codice': 'number',
-                'Proprietario': 'user_id',
-                'Cliente': 'partner_id',
-                'Descrizione': 'description',
-                'Stato': 'stage_id',
-                'Data inizio effettiva': 'assigned_date',
-                'Data creazione': 'create_date',
-                'Data Pianificazione': 'planned_date',
-            }
+            idx_map = self._csv_index_map(header, _HELPDESK_FIELD_MAPPING)
             
             created_count = 0
             updated_count = 0
@@ -2135,22 +2227,81 @@ class DbmImportWizard(models.TransientModel):
             created_tickets = []
             updated_tickets = []
             
-            for row_num, row in enumerate(reader, start=2):  # Start from 2 if header exists
+            # New tickets are queued and inserted in bulk once _IMPORT_BATCH_SIZE of them
+            # are pending. Rows for a ticket still in the queue are merged into it.
+            # Updates run in their own savepoint so a failing row doesn't abort the
+            # transaction, and are committed once every _IMPORT_BATCH_SIZE rows.
+            pending_creates = {}
+            uncommitted = 0
+            # Partners, users and stages are loaded once before the rows: partners and
+            # users by lowercased name, stages by name. Values without an exact match
+            # fall back to a search whose result is remembered for the following rows.
+            lookups = {
+                'partner_id': self._partner_name_index(),
+                'user_id': {},
+                'stage_id': {},
+            }
+            if not self.user_id:
+                for user in self.env['res.users'].search_fetch([], ['name'], order='id'):
+                    lookups['user_id'].setdefault(user.name.lower(), user.id)
+            for stage in self.env['helpdesk.ticket.stage'].search_read([], ['name'], order='sequence, id'):
+                lookups['stage_id'].setdefault(stage['name'], stage['id'])
+            created_entries = []
+            create_errors = []
+            ticket_name_cell = self._csv_cell_getter(header, 'Oggetto')
+            ticket_code_cell = self._csv_cell_getter(header, 'Codice')
+            rows = list(enumerate(reader, start=2))  # Start from 2 if header exists
+            ticket_index = self._helpdesk_ticket_index(rows, header)
+            # The stages used by the file and not found are created in one batch, before
+            # the rows, including the default 'Nuovo' stage of the rows without a stage
+            stage_cell = self._csv_column_getter(header, 'Stato')
+            new_stages = {}
+            for row_num, row in rows:
+                stage_value = stage_cell(row)
+                stage_key = stage_value.upper()
+                stage_name = _TICKET_STAGE_MAP.get(stage_key, stage_value) if stage_value else 'Nuovo'
+                if stage_name not in lookups['stage_id'] and stage_name not in new_stages:
+                    new_stages[stage_name] = {
+                        'name': stage_name,
+                        'sequence': 10,
+                        'closed': True if 'CHIUSO' in stage_key else False,
+                        'unattended': True if 'ATTESA' in stage_key or 'SOSPESO' in stage_key else False,
+                    }
+            if new_stages:
+                stages = self.env['helpdesk.ticket.stage'].create(list(new_stages.values()))
+                lookups['stage_id'].update(zip(new_stages, stages.ids))
+                _logger.info("Created new helpdesk stages: %s", ", ".join(new_stages))
+            # Write date of the updated tickets, shared by each committed batch
+            now = datetime.now()
+            for row_num, row in rows:
                 try:
-                    ticket_data = self._prepare_helpdesk_ticket_data(row, field_mapping)
+                    ticket_data = self._prepare_helpdesk_ticket_data(row, idx_map, lookups)
                     if ticket_data:
-                        result = self._create_or_update_helpdesk_ticket(ticket_data)
-                        if result['action'] == 'created':
-                            created_count += 1
-                            created_tickets.append(f"{ticket_data.get('name', 'N/A')} (Codice: {ticket_data.get('number', 'N/A')})")
-                        elif result['action'] == 'updated':
+                        key = ('number', ticket_data['number']) if ticket_data.get('number') else ('name', ticket_data['name'])
+                        if key in pending_creates:
+                            pending_creates[key]['vals'].update(ticket_data)
+                            pending_creates[key]['row'] = row_num
+                            continue
+                        existing_ticket_id = ticket_index.get(key)
+                        if existing_ticket_id:
+                            with self.env.cr.savepoint():
+                                self._update_helpdesk_ticket_sql(existing_ticket_id, ticket_data, now)
+                            uncommitted += 1
+                            if uncommitted >= _IMPORT_BATCH_SIZE:
+                                self._commit_import_batch()
+                                uncommitted = 0
+                                now = datetime.now()
                             updated_count += 1
                             updated_tickets.append(f"{ticket_data.get('name', 'N/A')} (Codice: {ticket_data.get('number', 'N/A')})")
+                        else:
+                            pending_creates[key] = {'vals': ticket_data, 'row': row_num, 'key': key}
+                            if len(pending_creates) >= _IMPORT_BATCH_SIZE:
+                                self._flush_helpdesk_tickets(pending_creates, ticket_index, created_entries, create_errors)
                     
                 except Exception as e:
                     error_count += 1
-                    ticket_name = row.get('Oggetto', 'N/A')
-                    ticket_code = row.get('Codice', 'N/A')
+                    ticket_name = ticket_name_cell(row)
+                    ticket_code = ticket_code_cell(row)
                     error_msg = f"Row {row_num} - {ticket_name} (Codice: {ticket_code}): {str(e)}"
                     errors.append(error_msg)
                     
@@ -2163,46 +2314,44 @@ class DbmImportWizard(models.TransientModel):
                         import_type="helpdesk_tickets"
                     )
                     
-                    _logger.error(f"Error importing helpdesk ticket at row {row_num}: {str(e)}")
+                    _logger.error("Error importing helpdesk ticket at row %s: %s", row_num, e)
+            
+            self._flush_helpdesk_tickets(pending_creates, ticket_index, created_entries, create_errors)
+            for ticket_id, entry in created_entries:
+                created_count += 1
+                created_tickets.append(f"{entry['vals'].get('name', 'N/A')} (Codice: {entry['vals'].get('number', 'N/A')})")
+            for entry, e in create_errors:
+                error_count += 1
+                error_msg = f"Row {entry['row']} - {entry['vals'].get('name', 'N/A')} (Codice: {entry['vals'].get('number', 'N/A')}): {str(e)}"
+                errors.append(error_msg)
+                self._log_import_error(
+                    error_type="Helpdesk Ticket Create/Update Error",
+                    message=error_msg,
+                    details=f"Ticket data: {entry['vals']}",
+                    row_number=entry['row'],
+                    import_type="helpdesk_tickets"
+                )
+                _logger.error("Error creating helpdesk ticket at row %s: %s", entry['row'], e)
             
             # Update note with detailed results
-            self.env.cr.commit()
-            result_message = f"Import ticket helpdesk completato:\n"
-            result_message += f"- Ticket creati: {created_count}\n"
-            result_message += f"- Ticket aggiornati: {updated_count}\n"
-            result_message += f"- Errori: {error_count}\n"
-            
-            # Show created tickets
-            if created_tickets:
-                result_message += f"\nTicket creati:\n"
-                for ticket in created_tickets[:10]:  # Show first 10
-                    result_message += f"- {ticket}\n"
-                if len(created_tickets) > 10:
-                    result_message += f"... e altri {len(created_tickets) - 10} ticket creati\n"
-            
-            # Show updated tickets
-            if updated_tickets:
-                result_message += f"\nTicket aggiornati:\n"
-                for ticket in updated_tickets[:10]:  # Show first 10
-                    result_message += f"- {ticket}\n"
-                if len(updated_tickets) > 10:
-                    result_message += f"... e altri {len(updated_tickets) - 10} ticket aggiornati\n"
-            
-            # Show errors
-            if errors:
-                result_message += f"\nErrori riscontrati:\n"
-                for error in errors[:10]:  # Show first 10 errors
-                    result_message += f"- {error}\n"
-                if len(errors) > 10:
-                    result_message += f"... e altri {len(errors) - 10} errori\n"
-            
-            self.note = result_message
+            self._commit_import_batch()
+            result_lines = [
+                "Import ticket helpdesk completato:",
+                f"- Ticket creati: {created_count}",
+                f"- Ticket aggiornati: {updated_count}",
+                f"- Errori: {error_count}",
+            ]
+            result_lines += self._result_section("Ticket creati", created_tickets, created_count, "e altri {} ticket creati")
+            result_lines += self._result_section("Ticket aggiornati", updated_tickets, updated_count, "e altri {} ticket aggiornati")
+            result_lines += self._result_section("Errori riscontrati", errors, len(errors), "e altri {} errori")
+            self.note = "\n".join(result_lines) + "\n"
             
             # Prepare notification message
             notification_msg = f"Creati: {created_count}, Aggiornati: {updated_count}"
             if error_count > 0:
                 notification_msg += f", Errori: {error_count}"
             
+            self._flush_import_errors()
             self.env.cr.commit()
             
             return {
@@ -2230,120 +2379,73 @@ class DbmImportWizard(models.TransientModel):
             _logger.error(error_msg)
             raise UserError(error_msg)
 
-    def _prepare_helpdesk_ticket_data(self, row, field_mapping):
+    def _prepare_helpdesk_ticket_data(self, row, idx_map, lookups):
         """
         Prepare helpdesk ticket data from CSV row
+        lookups maps 'partner_id' and 'user_id' to dicts of lowercased names to ids
+        (see _partner_name_index) and 'stage_id' to a dict of stage names to ids,
+        they are loaded once per import and extended along the way
         """
         ticket_data = {}
-        _logger.info(f"Preparing helpdesk ticket data from row: {row}")
+        _logger.debug("Preparing helpdesk ticket data from row: %s", row)
         
-        for csv_field, odoo_field in field_mapping.items():
-            if csv_field in row and row[csv_field].strip():
-                value = row[csv_field].strip()
-                
-                # Special handling for specific fields
-                if odoo_field == 'user_id':
-                    # Find user by name
-                    if self.user_id:
-                        ticket_data[odoo_field] = self.user_id.id
-                    else:
+        for csv_field, odoo_field, value in self._csv_row_values(row, idx_map):
+            # Special handling for specific fields
+            if odoo_field == 'user_id':
+                # Find user by name
+                if self.user_id:
+                    ticket_data[odoo_field] = self.user_id.id
+                else:
+                    user_ids = lookups['user_id']
+                    user_key = value.lower()
+                    if user_key not in user_ids:
                         user = self.env['res.users'].search([
                             ('name', 'ilike', value)
                         ], limit=1)
-                        if user:
-                            ticket_data[odoo_field] = user.id
-                        else:
-                            _logger.warning(f"User '{value}' not found, using current user")
-                            ticket_data[odoo_field] = self.env.user.id
-                        
-                elif odoo_field == 'partner_id':
-                    # Find partner by name
-                    partner = self.env['res.partner'].search([
-                        ('name', 'ilike', value)
-                    ], limit=1)
-                    if partner:
-                        ticket_data[odoo_field] = partner.id
-                        ticket_data['partner_name'] = value
-                    else:
-                        _logger.warning(f"Partner '{value}' not found")
-                        
-                elif odoo_field == 'stage_id':
-                    # Map stage names to helpdesk.ticket.stage
-                    stage_mapping = {
-                        'APERTO': 'Nuovo',
-                        'IN CORSO': 'In corso', 
-                        'IN ATTESA': 'In attesa',
-                        'CHIUSO - OK': 'Fatto',
-                        'CHIUSO - KO': 'Respinto',
-                        'ANNULLATO': 'Annullato',
-                        'PIANIFICAZIONE': 'Nuovo',  # Map to Nuovo for planning stage
-                        'SOSPESO': 'In attesa',  # Map to In attesa for suspended
-                    }
+                        if not user:
+                            _logger.warning("User '%s' not found, using current user", value)
+                        user_ids[user_key] = user.id or self.env.user.id
+                    ticket_data[odoo_field] = user_ids[user_key]
                     
-                    stage_key = value.strip().upper()
-                    stage_name = stage_mapping.get(stage_key, value.strip())
-                    
-                    # Find or create stage
-                    stage = self.env['helpdesk.ticket.stage'].search([('name', '=', stage_name)], limit=1)
-                    if not stage:
-                        # Create new stage if not found
-                        stage = self.env['helpdesk.ticket.stage'].create({
-                            'name': stage_name,
-                            'sequence': 10,
-                            'closed': True if 'CHIUSO' in stage_key else False,
-                            'unattended': True if 'ATTESA' in stage_key or 'SOSPESO' in stage_key else False,
-                        })
-                        _logger.info(f"Created new helpdesk stage: {stage_name}")
+            elif odoo_field == 'partner_id':
+                # Find partner by name
+                partner_id = self._match_partner_name(value, lookups['partner_id'])
+                if partner_id:
+                    ticket_data[odoo_field] = partner_id
+                    ticket_data['partner_name'] = value
+                else:
+                    _logger.warning("Partner '%s' not found", value)
                     
-                    ticket_data[odoo_field] = stage.id
+            elif odoo_field == 'stage_id':
+                # Map stage names to helpdesk.ticket.stage, stages are found or
+                # created for the whole file before the rows are processed
+                stage_name = _TICKET_STAGE_MAP.get(value.upper(), value)
+                ticket_data[odoo_field] = lookups['stage_id'][stage_name]
+                
+            elif odoo_field in ['assigned_date', 'create_date', 'planned_date']:
+                # Parse dates
+                try:
+                    parsed_date = _parse_date(value)
                     
-                elif odoo_field in ['assigned_date', 'create_date', 'planned_date']:
-                    # Parse dates
-                    try:
-                        date_formats = [
-                            '%d/%m/%Y %H:%M',      # 16/09/2025 9:30
-                            '%d/%m/%Y %H:%M:%S',   # 16/09/2025 9:30:00
-                            '%d/%m/%Y',            # 16/09/2025
-                            '%Y-%m-%d %H:%M:%S',   # 2025-09-16 09:30:00
-                            '%Y-%m-%d %H:%M',      # 2025-09-16 09:30
-                            '%Y-%m-%d',            # 2025-09-16
-                            '%d-%m-%Y %H:%M',      # 16-09-2025 9:30
-                            '%d-%m-%Y',            # 16-09-2025
-                        ]
-                        parsed_date = None
-                        
-                        for date_format in date_formats:
-                            try:
-                                parsed_date = datetime.strptime(value, date_format)
-                                break
-                            except ValueError:
-                                continue
-                        
-                        if parsed_date:
-                            # Convert to Odoo datetime format
-                            ticket_data[odoo_field] = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
-                            _logger.info(f"Successfully parsed date '{value}' as '{ticket_data[odoo_field]}' for field {odoo_field}")
-                        else:
-                            _logger.warning(f"Unable to parse date '{value}' for field {odoo_field}")
-                    except Exception as e:
-                        _logger.warning(f"Error parsing date '{value}': {str(e)}")
-                        
-                elif odoo_field == 'description':
-                    # Convert plain text to HTML for description field
-                    if value:
-                        # Escape HTML characters and convert line breaks
-                        import html
-                        escaped_value = html.escape(value)
-                        html_value = escaped_value.replace('\n', '<br/>')
-                        ticket_data[odoo_field] = f"<p>{html_value}</p>"
+                    if parsed_date:
+                        # Convert to Odoo datetime format
+                        ticket_data[odoo_field] = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
+                        _logger.debug("Successfully parsed date '%s' as '%s' for field %s", value, ticket_data[odoo_field], odoo_field)
                     else:
-                        ticket_data[odoo_field] = "<p></p>"
-                        
-                else:
-                    ticket_data[odoo_field] = value
-        
+                        _logger.warning("Unable to parse date '%s' for field %s", value, odoo_field)
+                except Exception as e:
+                    _logger.warning("Error parsing date '%s': %s", value, e)
+                    
+            elif odoo_field == 'description':
+                # Convert plain text to HTML for description field, escaping HTML
+                # characters and converting line breaks in a single pass
+                ticket_data[odoo_field] = f"<p>{value.translate(_HTML_TEXT_MAP)}</p>"
+                    
+            else:
+                ticket_data[odoo_field] = value
+    
         # Set default values and validate required fields
-        if 'name' not in ticket_data or not ticket_data['name'].strip():
+        if not ticket_data.get('name'):
             error_msg = "Ticket name (Oggetto) is required"
             self._log_import_error(
                 error_type="Helpdesk Ticket Validation Error",
@@ -2363,193 +2465,116 @@ class DbmImportWizard(models.TransientModel):
             
         # Set default stage if not provided
         if 'stage_id' not in ticket_data:
-            default_stage = self.env['helpdesk.ticket.stage'].search([('name', '=', 'Nuovo')], limit=1)
-            if not default_stage:
-                default_stage = self.env['helpdesk.ticket.stage'].create({
-                    'name': 'Nuovo',
-                    'sequence': 10,
-                    'closed': False,
-                    'unattended': False,
-                })
-            ticket_data['stage_id'] = default_stage.id
+            ticket_data['stage_id'] = lookups['stage_id']['Nuovo']
         
-        _logger.info(f"Final helpdesk ticket data prepared: {ticket_data}")
+        _logger.debug("Final helpdesk ticket data prepared: %s", ticket_data)
         ticket_data.update({'active': True, })
         return ticket_data
 
-    def _create_or_update_helpdesk_ticket(self, ticket_data):
+    def _flush_helpdesk_tickets(self, pending_creates, ticket_index, created_entries, create_errors):
         """
-        Create or update helpdesk ticket record using SQL
-        Returns dict with action info: {'action': 'created'|'updated', 'ticket': ticket_record}
+        Insert the queued helpdesk tickets in bulk and commit them, collecting
+        the created (ticket id, entry) and failed (entry, exception) tuples.
+        The created tickets are added to ticket_index, see _helpdesk_ticket_index.
         """
-        try:
-            _logger.info(f"Attempting to create/update helpdesk ticket with data: {ticket_data}")
-            
-            # Check if ticket already exists by number or name
-            existing_ticket_id = None
-            if 'number' in ticket_data and ticket_data['number']:
-                _logger.info(f"Searching for existing ticket by number: {ticket_data['number']}")
-                self.env.cr.execute(
-                    "SELECT id FROM helpdesk_ticket WHERE number = %s LIMIT 1",
-                    (ticket_data['number'],)
-                )
-                result = self.env.cr.fetchone()
-                if result:
-                    existing_ticket_id = result[0]
-            else:
-                _logger.info(f"Searching for existing ticket by name: {ticket_data['name']}")
+        if not pending_creates:
+            return
+        created, errors = self._create_helpdesk_tickets_bulk(list(pending_creates.values()))
+        pending_creates.clear()
+        for ticket_id, entry in created:
+            ticket_index[entry['key']] = ticket_id
+        created_entries += created
+        create_errors += errors
+        self._commit_import_batch()
+
+    def _helpdesk_ticket_index(self, rows, header):
+        """
+        Map ('number', number) and ('name', name) keys to the ids of the existing
+        helpdesk tickets, with one query for the ticket numbers ('Codice') of the
+        file and one for the names ('Oggetto') of its rows without a number
+        """
+        number_cell = self._csv_column_getter(header, 'Codice')
+        name_cell = self._csv_column_getter(header, 'Oggetto')
+        numbers = list({number_cell(row) for row_num, row in rows} - {''})
+        names = list({name_cell(row) for row_num, row in rows if not number_cell(row)} - {''})
+        
+        self.env['helpdesk.ticket'].flush_model(['number', 'name'])
+        ticket_index = {}
+        for column, values in (('number', numbers), ('name', names)):
+            if values:
                 self.env.cr.execute(
-                    "SELECT id FROM helpdesk_ticket WHERE name = %s LIMIT 1",
-                    (ticket_data['name'],)
+                    f"SELECT {column}, id FROM helpdesk_ticket WHERE {column} = ANY(%s) ORDER BY id",
+                    (values,)
                 )
-                result = self.env.cr.fetchone()
-                if result:
-                    existing_ticket_id = result[0]
-            
-            if existing_ticket_id:
-                # Update existing ticket using SQL
-                _logger.info(f"Updating existing ticket ID: {existing_ticket_id}")
-                self._update_helpdesk_ticket_sql(existing_ticket_id, ticket_data)
-                _logger.info(f"Successfully updated ticket: {ticket_data.get('name')} (ID: {existing_ticket_id})")
-                return {'action': 'updated', 'ticket': self.env['helpdesk.ticket'].browse(existing_ticket_id)}
-            else:
-                # Create new ticket using SQL
-                _logger.info(f"Creating new ticket with data: {ticket_data}")
-                new_ticket_id = self._create_helpdesk_ticket_sql(ticket_data)
-                _logger.info(f"Successfully created new ticket: {ticket_data.get('name')} (ID: {new_ticket_id})")
-                return {'action': 'created', 'ticket': self.env['helpdesk.ticket'].browse(new_ticket_id)}
-                
-        except Exception as e:
-            error_msg = f"Error creating/updating helpdesk ticket {ticket_data.get('name', 'N/A')}: {str(e)}"
-            
-            # Log error to ir.logging
-            self._log_import_error(
-                error_type="Helpdesk Ticket Create/Update Error",
-                message=error_msg,
-                details=f"Ticket data: {ticket_data}",
-                import_type="helpdesk_tickets"
-            )
-            
-            _logger.error(error_msg)
-            raise ValidationError(f"Error creating/updating helpdesk ticket: {str(e)}")
+                for value, ticket_id in self.env.cr.fetchall():
+                    ticket_index.setdefault((column, value), ticket_id)
+        return ticket_index
 
-    def _create_helpdesk_ticket_sql(self, ticket_data):
+    def _create_helpdesk_tickets_bulk(self, entries):
         """
-        Create helpdesk ticket using direct SQL
+        Insert queued helpdesk tickets ({'vals': ticket_data, 'row': ...} dicts) with
+        execute_values. A failing batch is replayed row by row so that errors are still
+        reported against their CSV row.
+        Returns (created, errors): (ticket id, entry) and (entry, exception) tuples.
         """
+        now = datetime.now()
+        numbers = iter(self._generate_ticket_numbers(
+            sum(1 for entry in entries if not entry['vals'].get('number'))
+        ))
+        values = [
+            self._helpdesk_ticket_values(entry['vals'], entry['vals'].get('number') or next(numbers), now)
+            for entry in entries
+        ]
+        
         try:
-            # Prepare SQL fields and values
-            field_names = []
-            values = []
-            placeholders = []
-            
-            # Required fields
-            field_names.append('name')
-            values.append(ticket_data.get('name', ''))
-            placeholders.append('%s')
-            
-            field_names.append('description')
-            values.append(ticket_data.get('description', '<p></p>'))
-            placeholders.append('%s')
-            
-            field_names.append('user_id')
-            values.append(ticket_data.get('user_id', self.env.user.id))
-            placeholders.append('%s')
-            
-            field_names.append('stage_id')
-            values.append(ticket_data.get('stage_id'))
-            placeholders.append('%s')
-            
-            field_names.append('active')
-            values.append(ticket_data.get('active', True))
-            placeholders.append('%s')
-            
-            field_names.append('company_id')
-            values.append(ticket_data.get('company_id', self.env.company.id))
-            placeholders.append('%s')
-            
-            field_names.append('create_uid')
-            values.append(self.env.user.id)
-            placeholders.append('%s')
-            
-            field_names.append('create_date')
-            values.append(datetime.now())
-            placeholders.append('%s')
-            
-            field_names.append('write_uid')
-            values.append(self.env.user.id)
-            placeholders.append('%s')
-            
-            field_names.append('write_date')
-            values.append(datetime.now())
-            placeholders.append('%s')
-            
-            # Optional fields
-            if 'number' in ticket_data and ticket_data['number']:
-                field_names.append('number')
-                values.append(ticket_data['number'])
-                placeholders.append('%s')
-            else:
-                # Generate sequence number
-                seq_number = self._generate_ticket_number()
-                field_names.append('number')
-                values.append(seq_number)
-                placeholders.append('%s')
-            
-            if 'partner_id' in ticket_data and ticket_data['partner_id']:
-                field_names.append('partner_id')
-                values.append(ticket_data['partner_id'])
-                placeholders.append('%s')
-            
-            if 'partner_name' in ticket_data and ticket_data['partner_name']:
-                field_names.append('partner_name')
-                values.append(ticket_data['partner_name'])
-                placeholders.append('%s')
-            
-            if 'assigned_date' in ticket_data and ticket_data['assigned_date']:
-                field_names.append('assigned_date')
-                values.append(ticket_data['assigned_date'])
-                placeholders.append('%s')
-            
-            if 'closed_date' in ticket_data and ticket_data['closed_date']:
-                field_names.append('closed_date')
-                values.append(ticket_data['closed_date'])
-                placeholders.append('%s')
-            
-            if 'last_stage_update' in ticket_data and ticket_data['last_stage_update']:
-                field_names.append('last_stage_update')
-                values.append(ticket_data['last_stage_update'])
-                placeholders.append('%s')
-            else:
-                field_names.append('last_stage_update')
-                values.append(datetime.now())
-                placeholders.append('%s')
-            
-            # Build and execute SQL
-            fields_str = ', '.join(field_names)
-            placeholders_str = ', '.join(placeholders)
-            
-            sql = f"""
-                INSERT INTO helpdesk_ticket ({fields_str})
-                VALUES ({placeholders_str})
-                RETURNING id
-            """
-            
-            self.env.cr.execute(sql, values)
-            ticket_id = self.env.cr.fetchone()[0]
-            self.env.cr.commit()
-            
-            _logger.info(f"Created helpdesk ticket with SQL - ID: {ticket_id}")
-            return ticket_id
-            
+            with self.env.cr.savepoint():
+                ticket_ids = [row[0] for row in execute_values(self.env.cr._obj, _TICKET_INSERT_SQL, values, page_size=500, fetch=True)]
+            created = list(zip(ticket_ids, entries))
+            errors = []
         except Exception as e:
-            self.env.cr.rollback()
-            _logger.error(f"Error creating helpdesk ticket with SQL: {str(e)}")
-            raise
+            _logger.warning("Bulk insert of %s helpdesk tickets failed, retrying row by row: %s", len(entries), e)
+            created = []
+            errors = []
+            for entry, ticket_values in zip(entries, values):
+                try:
+                    with self.env.cr.savepoint():
+                        ticket_id = execute_values(self.env.cr._obj, _TICKET_INSERT_SQL, [ticket_values], fetch=True)[0][0]
+                    created.append((ticket_id, entry))
+                except Exception as e:
+                    errors.append((entry, e))
+        
+        _logger.info("Created %s helpdesk tickets with SQL, %s errors", len(created), len(errors))
+        return created, errors
+
+    def _helpdesk_ticket_values(self, ticket_data, number, now):
+        """
+        Return the _TICKET_COLUMNS values of a new ticket, optional columns
+        without a value are inserted as NULL. now is the timestamp of the batch.
+        """
+        ticket_row = {
+            # Required fields
+            'name': ticket_data.get('name', ''),
+            'description': ticket_data.get('description', '<p></p>'),
+            'user_id': ticket_data.get('user_id', self.env.user.id),
+            'stage_id': ticket_data.get('stage_id'),
+            'active': ticket_data.get('active', True),
+            'company_id': ticket_data.get('company_id', self.env.company.id),
+            'create_uid': self.env.user.id,
+            'create_date': now,
+            'write_uid': self.env.user.id,
+            'write_date': now,
+            'number': number,
+        }
+        
+        # Optional fields
+        for field_name in ('partner_id', 'partner_name', 'assigned_date', 'closed_date'):
+            ticket_row[field_name] = ticket_data.get(field_name) or None
+        ticket_row['last_stage_update'] = ticket_data.get('last_stage_update') or now
+        return tuple(ticket_row[column] for column in _TICKET_COLUMNS)
 
-    def _update_helpdesk_ticket_sql(self, ticket_id, ticket_data):
+    def _update_helpdesk_ticket_sql(self, ticket_id, ticket_data, now):
         """
-        Update helpdesk ticket using direct SQL
+        Update helpdesk ticket using direct SQL, now being the write date
         """
         try:
             # Prepare SQL fields and values for update
@@ -2602,7 +2627,7 @@ class DbmImportWizard(models.TransientModel):
             values.append(self.env.user.id)
             
             set_clauses.append('write_date = %s')
-            values.append(datetime.now())
+            values.append(now)
             
             # Add ticket_id to values
             values.append(ticket_id)
@@ -2612,15 +2637,39 @@ class DbmImportWizard(models.TransientModel):
             sql = f"UPDATE helpdesk_ticket SET {set_clause} WHERE id = %s"
             
             self.env.cr.execute(sql, values)
-            self.env.cr.commit()
             
-            _logger.info(f"Updated helpdesk ticket with SQL - ID: {ticket_id}")
+            _logger.debug("Updated helpdesk ticket with SQL - ID: %s", ticket_id)
             
         except Exception as e:
-            self.env.cr.rollback()
-            _logger.error(f"Error updating helpdesk ticket with SQL: {str(e)}")
+            _logger.error("Error updating helpdesk ticket with SQL: %s", e)
             raise
 
+    def _generate_ticket_numbers(self, count):
+        """
+        Generate count ticket numbers. Standard sequences are advanced with a single
+        query, others fall back to one next_by_code call per number.
+        """
+        if not count:
+            return []
+        seq = self.env['ir.sequence']
+        if hasattr(self, 'company_id') and self.company_id:
+            seq = seq.with_company(self.company_id.id)
+        sequence = seq.search([
+            ('code', '=', 'helpdesk.ticket.sequence'),
+            ('company_id', 'in', [seq.env.company.id, False]),
+        ], order='company_id', limit=1)
+        if sequence and sequence.implementation == 'standard' and not sequence.use_date_range:
+            try:
+                with self.env.cr.savepoint():
+                    self.env.cr.execute(
+                        "SELECT nextval(%s) FROM generate_series(1, %s)",
+                        ('ir_sequence_%03d' % sequence.id, count)
+                    )
+                    return [sequence.get_next_char(number) for number, in self.env.cr.fetchall()]
+            except Exception as e:
+                _logger.warning("Error generating ticket numbers in bulk: %s", e)
+        return [self._generate_ticket_number() for i in range(count)]
+
     def _generate_ticket_number(self):
         """
         Generate ticket number using sequence
@@ -2631,5 +2680,5 @@ class DbmImportWizard(models.TransientModel):
                 seq = seq.with_company(self.company_id.id)
             return seq.next_by_code('helpdesk.ticket.sequence') or '/'
         except Exception as e:
-            _logger.warning(f"Error generating ticket number: {str(e)}")
+            _logger.warning("Error generating ticket number: %s", e)
             return f"TICKET-{int(datetime.now().timestamp())}"
\ No newline at end of file